@@ -1,46 +1,209 @@
-"""The Sony Projector ADCP integration."""
+"""The Sony Projector ADCP integration.
+
+Home Assistant and the runtime modules in ``runtime.py`` are only imported
+once an entry is set up, so the ADCP client in ``protocol.py`` and the
+command line tool can be imported from this package quickly and without
+Home Assistant installed.
+"""
+from __future__ import annotations
+
+from datetime import timedelta
 import logging
+import os
+from typing import TYPE_CHECKING, Any, Dict
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
+from .const import (
+    CONF_HOST,
+    CONF_MODEL,
+    CONF_PASSWORD,
+    CONF_PICTURE_RULES,
+    CONF_PORT,
+    CONF_PROXY_HOST,
+    CONF_PROXY_PORT,
+    CONF_RECORD_TRAFFIC,
+    CONF_USE_AUTH,
+    DEFAULT_MODEL,
+    DEFAULT_PASSWORD,
+    DEFAULT_PROXY_HOST,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_RECORD_TRAFFIC,
+    DEFAULT_USE_AUTH,
+    DOMAIN,
+    EVENT_PROJECTOR_ERROR,
+    FALLBACK_PROFILE,
+    MODEL_AUTO,
+    SIGNAL_TELEMETRY_UPDATED,
+    TELEMETRY_INTERVAL,
+)
+from .models import ModelProfile, find_profile, load_profile
+from .protocol import SonyProjectorADCP, TrafficRecorder
 
-from .const import CONF_USE_AUTH, DEFAULT_PASSWORD, DEFAULT_USE_AUTH, DOMAIN
-from .protocol import SonyProjectorADCP
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .runtime import SonyProjectorData
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.MEDIA_PLAYER]
+PLATFORMS = ["media_player", "number", "select", "sensor", "switch"]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Sony Projector ADCP from a config entry."""
+    # pylint: disable-next=import-outside-toplevel
+    from .runtime import async_start_proxy, create_data
+
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
     password = entry.data.get(CONF_PASSWORD, DEFAULT_PASSWORD)
     use_auth = entry.data.get(CONF_USE_AUTH, DEFAULT_USE_AUTH)
+    model = entry.data.get(CONF_MODEL, DEFAULT_MODEL)
 
-    projector = SonyProjectorADCP(host, port, password, use_auth)
+    # Profiles are compiled once here so nothing is re-encoded while polling
+    profile = await hass.async_add_executor_job(
+        load_profile, FALLBACK_PROFILE if model == MODEL_AUTO else model
+    )
+    projector = SonyProjectorADCP(host, port, password, use_auth, profile)
 
     # Test connection
     if not await projector.connect():
         _LOGGER.error("Failed to connect to projector at %s:%s", host, port)
         return False
 
+    if model == MODEL_AUTO:
+        projector.profile = await _async_detect_profile(hass, projector, profile)
+
     await projector.disconnect()
 
+    if entry.options.get(CONF_RECORD_TRAFFIC, DEFAULT_RECORD_TRAFFIC):
+        path = hass.config.path(DOMAIN, f"{host}_{port}.adcp")
+        projector.recorder = await hass.async_add_executor_job(_create_recorder, path)
+        _LOGGER.info("Recording ADCP traffic for %s to %s", host, path)
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    data = create_data(
+        projector, entry.options.get(CONF_PICTURE_RULES, []), _reload_options(entry)
+    )
+
+    if proxy_port := entry.options.get(CONF_PROXY_PORT, DEFAULT_PROXY_PORT):
+        await async_start_proxy(
+            data,
+            entry.options.get(CONF_PROXY_HOST, DEFAULT_PROXY_HOST),
+            proxy_port,
+            password,
+            use_auth,
+        )
+
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = projector
+    hass.data[DOMAIN][entry.entry_id] = data
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    _async_start_telemetry(hass, entry, data)
+
     return True
 
 
+def _async_start_telemetry(
+    hass: HomeAssistant, entry: ConfigEntry, data: SonyProjectorData
+) -> None:
+    """Sample telemetry on its own slow tier."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.dispatcher import async_dispatcher_send
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.event import async_track_time_interval
+
+    signal = SIGNAL_TELEMETRY_UPDATED.format(entry.entry_id)
+
+    async def _async_sample(*_) -> None:
+        try:
+            new_codes = await data.telemetry.async_sample()
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.debug("Error sampling telemetry: %s", e)
+            return
+
+        for channel, codes in new_codes.items():
+            for code in codes:
+                hass.bus.async_fire(
+                    EVENT_PROJECTOR_ERROR,
+                    {
+                        "entry_id": entry.entry_id,
+                        "host": data.projector.host,
+                        "type": channel,
+                        "code": code,
+                    },
+                )
+        async_dispatcher_send(hass, signal)
+
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass, _async_sample, timedelta(seconds=TELEMETRY_INTERVAL)
+        )
+    )
+    hass.async_create_task(_async_sample())
+
+
+def _create_recorder(path: str) -> TrafficRecorder:
+    """Create a traffic recorder, making its directory if needed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return TrafficRecorder(path)
+
+
+def _reload_options(entry: ConfigEntry) -> Dict[str, Any]:
+    """Return the options that need a reload when they change."""
+    # Picture rules are swapped in place by the set_picture_rules service
+    return {
+        key: value
+        for key, value in entry.options.items()
+        if key != CONF_PICTURE_RULES
+    }
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if data is not None and data.options == _reload_options(entry):
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def _async_detect_profile(
+    hass: HomeAssistant, projector: SonyProjectorADCP, fallback: ModelProfile
+) -> ModelProfile:
+    """Pick the profile matching the model name reported by the projector."""
+    model_name = await projector.get_model_name()
+    if not model_name:
+        _LOGGER.warning(
+            "Could not read model name from %s, using %s profile",
+            projector.host,
+            fallback.name,
+        )
+        return fallback
+
+    profile = await hass.async_add_executor_job(find_profile, model_name)
+    if profile is None:
+        _LOGGER.warning(
+            "No profile declares model %s, using %s profile", model_name, fallback.name
+        )
+        return fallback
+
+    _LOGGER.debug("Detected %s, using %s profile", model_name, profile.name)
+    return profile
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        projector = hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        data.transitions.cancel_all()
+        data.picture_rules.cancel()
+        if data.proxy:
+            await data.proxy.stop()
+        projector = data.projector
         await projector.disconnect()
+        if projector.recorder:
+            await hass.async_add_executor_job(projector.recorder.close)
 
     return unload_ok
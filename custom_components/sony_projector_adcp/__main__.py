@@ -0,0 +1,6 @@
+"""Run the Sony Projector ADCP command line interface."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,262 @@
+"""Command line interface for Sony projectors over ADCP.
+
+Runs without Home Assistant. Every command accepts one or more hosts and
+talks to all of them in parallel.
+
+Usage::
+
+    python -m custom_components.sony_projector_adcp -H 192.168.1.100 -H 192.168.1.101 status
+    python -m custom_components.sony_projector_adcp -H 192.168.1.100 set brightness 60
+    python -m custom_components.sony_projector_adcp -H 192.168.1.100 watch --interval 2
+    echo 'contrast ?' | python -m custom_components.sony_projector_adcp -H 192.168.1.100 exec
+    python -m custom_components.sony_projector_adcp -H 192.168.1.100 proxy --listen-port 53600
+"""
+import argparse
+import asyncio
+from datetime import datetime
+import json
+import logging
+import sys
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from .const import (
+    DEFAULT_PASSWORD,
+    DEFAULT_PORT,
+    DEFAULT_PROXY_HOST,
+    MODEL_AUTO,
+    PROXY_CACHE_TTL,
+    SCAN_INTERVAL,
+)
+from .models import TYPE_INT
+from .protocol import SonyProjectorADCP, async_open_projector
+from .proxy import ADCPProxy
+from .response import is_error
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_PARAMETERS = (
+    "power_status",
+    "input",
+    "blank",
+    "picture_mode",
+    "brightness",
+    "contrast",
+    "sharpness",
+    "light_output_val",
+    "real_cre",
+)
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+
+
+def _parse_host(value: str, default_port: int) -> Tuple[str, int]:
+    """Split host[:port]."""
+    host, _, port = value.partition(":")
+    return host, int(port) if port else default_port
+
+
+async def _async_open(args: argparse.Namespace, target: str) -> SonyProjectorADCP:
+    """Connect to one projector and pick its profile."""
+    host, port = _parse_host(target, args.port)
+    return await async_open_projector(
+        host, port, args.password, not args.no_auth, args.model
+    )
+
+
+def _print_result(
+    args: argparse.Namespace, projector: SonyProjectorADCP, result: Dict[str, Any]
+) -> None:
+    """Print the result for one host."""
+    host = projector.host
+    if projector.port != args.port:
+        host = f"{host}:{projector.port}"
+    if args.json:
+        print(json.dumps({"host": host, **result}), flush=True)
+    else:
+        fields = " ".join(f"{key}={value}" for key, value in result.items())
+        print(f"{host}\t{fields}", flush=True)
+
+
+async def _async_status(args: argparse.Namespace, projector: SonyProjectorADCP) -> int:
+    """Print the current status."""
+    state = await projector.query_many(STATUS_PARAMETERS)
+    _print_result(args, projector, state)
+    return EXIT_OK
+
+
+async def _async_set(args: argparse.Namespace, projector: SonyProjectorADCP) -> int:
+    """Set one parameter."""
+    spec = projector.profile.parameter(args.parameter)
+    value: Any = int(args.value) if spec.kind == TYPE_INT else args.value
+    success = await projector.set_value(args.parameter, value)
+    _print_result(args, projector, {args.parameter: value, "ok": success})
+    return EXIT_OK if success else EXIT_FAILED
+
+
+async def _async_watch(args: argparse.Namespace, projector: SonyProjectorADCP) -> int:
+    """Poll the status and print every change until interrupted."""
+    previous: Dict[str, Any] = {}
+    while True:
+        state = await projector.query_many(STATUS_PARAMETERS)
+        changes = {
+            key: value for key, value in state.items() if previous.get(key) != value
+        }
+        if changes:
+            if not args.json:
+                print(f"{datetime.now().isoformat(timespec='seconds')} ", end="")
+            _print_result(args, projector, changes)
+        previous = state
+        await asyncio.sleep(args.interval)
+
+
+async def _async_exec(args: argparse.Namespace, projector: SonyProjectorADCP) -> int:
+    """Send the batch of commands read from a file or stdin."""
+    responses = await projector.send_batch(args.commands)
+    status = EXIT_OK
+    for command, response in zip(args.commands, responses):
+        if response is None or is_error(response):
+            status = EXIT_FAILED
+        _print_result(args, projector, {"command": command, "response": response})
+    return status
+
+
+async def _async_proxy(args: argparse.Namespace, projector: SonyProjectorADCP) -> int:
+    """Serve downstream ADCP clients over this projector's session until interrupted."""
+    # Each further host listens on the next port
+    targets = [_parse_host(target, args.port) for target in args.hosts]
+    port = args.listen_port + targets.index((projector.host, projector.port))
+    proxy = ADCPProxy(projector, args.password, not args.no_auth, args.cache_ttl)
+    await proxy.start(args.listen, port)
+    _print_result(args, projector, {"proxy": f"{args.listen}:{proxy.port}"})
+    try:
+        await proxy.serve_forever()
+    finally:
+        await proxy.stop()
+    return EXIT_OK
+
+
+def _read_commands(source: TextIO) -> List[str]:
+    """Read one command per line, skipping blanks and # comments."""
+    commands = []
+    for line in source:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            commands.append(line)
+    return commands
+
+
+async def _async_run_host(args: argparse.Namespace, target: str) -> int:
+    """Run the selected command against one host."""
+    try:
+        projector = await _async_open(args, target)
+    except (ConnectionError, OSError, ValueError) as e:
+        print(f"{target}\terror={e}", file=sys.stderr, flush=True)
+        return EXIT_FAILED
+
+    try:
+        return await args.handler(args, projector)
+    except ValueError as e:
+        print(f"{target}\terror={e}", file=sys.stderr, flush=True)
+        return EXIT_FAILED
+    finally:
+        await projector.disconnect()
+
+
+async def _async_main(args: argparse.Namespace) -> int:
+    """Run the selected command against all hosts in parallel."""
+    results = await asyncio.gather(
+        *(_async_run_host(args, host) for host in args.hosts)
+    )
+    return max(results, default=EXIT_OK)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="sony_projector_adcp", description="Control Sony projectors over ADCP"
+    )
+    parser.add_argument(
+        "-H",
+        "--host",
+        dest="hosts",
+        action="append",
+        required=True,
+        help="projector host[:port], repeat for several projectors",
+    )
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="default ADCP port")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="ADCP password")
+    parser.add_argument("--no-auth", action="store_true", help="disable authentication")
+    parser.add_argument(
+        "--model",
+        default=MODEL_AUTO,
+        help="model profile, e.g. vpl_xw5000 (default: detect from the projector)",
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    status = commands.add_parser("status", help="print the current status")
+    status.set_defaults(handler=_async_status)
+
+    set_parser = commands.add_parser("set", help="set a parameter")
+    set_parser.add_argument("parameter", help="parameter name, e.g. brightness")
+    set_parser.add_argument("value", help="new value")
+    set_parser.set_defaults(handler=_async_set)
+
+    watch = commands.add_parser("watch", help="stream status changes")
+    watch.add_argument(
+        "--interval", type=float, default=SCAN_INTERVAL, help="poll interval in seconds"
+    )
+    watch.set_defaults(handler=_async_watch)
+
+    exec_parser = commands.add_parser("exec", help="send a batch of raw commands")
+    exec_parser.add_argument(
+        "file",
+        nargs="?",
+        type=argparse.FileType("r"),
+        default=sys.stdin,
+        help="file with one command per line (default: stdin)",
+    )
+    exec_parser.set_defaults(handler=_async_exec)
+
+    proxy = commands.add_parser(
+        "proxy", help="share one projector session with many ADCP clients"
+    )
+    proxy.add_argument(
+        "--listen",
+        default=DEFAULT_PROXY_HOST,
+        help="address to listen on, 0.0.0.0 for every interface",
+    )
+    proxy.add_argument(
+        "--listen-port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="port to listen on, the next hosts use the following ports",
+    )
+    proxy.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=PROXY_CACHE_TTL,
+        help="seconds a query response is reused",
+    )
+    proxy.set_defaults(handler=_async_proxy)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the command line interface."""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.CRITICAL)
+
+    if args.command == "exec":
+        args.commands = _read_commands(args.file)
+        if not args.commands:
+            return EXIT_OK
+
+    try:
+        return asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        return EXIT_OK
@@ -10,13 +10,24 @@ from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
 from .const import (
+    CONF_MODEL,
+    CONF_PROXY_HOST,
+    CONF_PROXY_PORT,
+    CONF_RECORD_TRAFFIC,
     CONF_USE_AUTH,
+    DEFAULT_MODEL,
     DEFAULT_NAME,
     DEFAULT_PASSWORD,
     DEFAULT_PORT,
+    DEFAULT_PROXY_HOST,
+    DEFAULT_PROXY_PORT,
+    DEFAULT_RECORD_TRAFFIC,
     DEFAULT_USE_AUTH,
     DOMAIN,
+    FALLBACK_PROFILE,
+    MODEL_AUTO,
 )
+from .models import available_profiles, load_profile
 from .protocol import SonyProjectorADCP
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,11 +35,14 @@ _LOGGER = logging.getLogger(__name__)
 
 async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate the user input allows us to connect."""
+    # Profiles are read from disk, so never let the client load one lazily here
+    profile = await hass.async_add_executor_job(load_profile, FALLBACK_PROFILE)
     projector = SonyProjectorADCP(
         host=data[CONF_HOST],
         port=data[CONF_PORT],
         password=data.get(CONF_PASSWORD, ""),
         use_auth=data.get(CONF_USE_AUTH, True),
+        profile=profile,
     )
 
     # Test connection
@@ -65,11 +79,15 @@ class SonyProjectorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
 
+        models = {MODEL_AUTO: "Auto-detect"}
+        models.update(await self.hass.async_add_executor_job(available_profiles))
+
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_HOST): str,
                 vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
                 vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
+                vol.Optional(CONF_MODEL, default=DEFAULT_MODEL): vol.In(models),
                 vol.Optional(CONF_USE_AUTH, default=DEFAULT_USE_AUTH): bool,
                 vol.Optional(CONF_PASSWORD, default=DEFAULT_PASSWORD): str,
             }
@@ -96,7 +114,10 @@ class SonyProjectorOptionsFlow(config_entries.OptionsFlow):
     async def async_step_init(self, user_input=None):
         """Manage the options."""
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            # Keep options the form does not show, such as the picture rules
+            return self.async_create_entry(
+                title="", data={**self.config_entry.options, **user_input}
+            )
 
         return self.async_show_form(
             step_id="init",
@@ -114,6 +135,24 @@ class SonyProjectorOptionsFlow(config_entries.OptionsFlow):
                             CONF_PASSWORD, DEFAULT_PASSWORD
                         ),
                     ): str,
+                    vol.Optional(
+                        CONF_RECORD_TRAFFIC,
+                        default=self.config_entry.options.get(
+                            CONF_RECORD_TRAFFIC, DEFAULT_RECORD_TRAFFIC
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_PROXY_HOST,
+                        default=self.config_entry.options.get(
+                            CONF_PROXY_HOST, DEFAULT_PROXY_HOST
+                        ),
+                    ): str,
+                    vol.Optional(
+                        CONF_PROXY_PORT,
+                        default=self.config_entry.options.get(
+                            CONF_PROXY_PORT, DEFAULT_PROXY_PORT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
                 }
             ),
         )
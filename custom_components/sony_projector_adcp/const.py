@@ -7,36 +7,41 @@ CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_PASSWORD = "password"
 CONF_USE_AUTH = "use_auth"
+CONF_MODEL = "model"
+CONF_RECORD_TRAFFIC = "record_traffic"
+CONF_PROXY_PORT = "proxy_port"
+CONF_PROXY_HOST = "proxy_host"
+CONF_PICTURE_RULES = "picture_rules"
 
 # Defaults
 DEFAULT_PORT = 53595
 DEFAULT_PASSWORD = "Projector"
 DEFAULT_USE_AUTH = True
 DEFAULT_NAME = "Sony Projector"
+DEFAULT_RECORD_TRAFFIC = False
+DEFAULT_PROXY_PORT = 0  # disabled
+DEFAULT_PROXY_HOST = "127.0.0.1"
+
+# Model profiles (see models.py and the profiles directory)
+MODEL_AUTO = "auto"
+DEFAULT_MODEL = MODEL_AUTO
+FALLBACK_PROFILE = "vpl_xw5000"
 
 # Update intervals
 SCAN_INTERVAL = 30  # seconds
+# Seconds a single refresh may take, including connecting. Kept well inside
+# the scan interval so a slow refresh is done before the next one is due.
+UPDATE_BUDGET = SCAN_INTERVAL / 3
+TELEMETRY_INTERVAL = 300  # seconds
+PROXY_CACHE_TTL = 1.0  # seconds a proxied query response is reused
+SIGNAL_POLL_INTERVAL = 0.25  # seconds between signal reads after an input change
+SIGNAL_WINDOW = 15  # seconds to wait for a valid signal after an input change
+SIGNAL_SETTLE = 0.75  # seconds an unchanged signal must hold after an input change
 
-# Input sources for VPL-XW5000
-INPUT_SOURCES = {
-    "hdmi1": "HDMI 1",
-    "hdmi2": "HDMI 2",
-}
-
-# Picture modes for VPL-XW5000
-PICTURE_MODES = {
-    "cinema_film1": "Cinema Film 1",
-    "cinema_film2": "Cinema Film 2",
-    "reference": "Reference",
-    "tv": "TV",
-    "photo": "Photo",
-    "game": "Game",
-    "brt_cinema": "Bright Cinema",
-    "brt_tv": "Bright TV",
-    "user1": "User 1",
-    "user2": "User 2",
-    "user3": "User 3",
-}
+# Dispatcher signals and events
+SIGNAL_TELEMETRY_UPDATED = f"{DOMAIN}_telemetry_updated_{{}}"
+SIGNAL_STATE_UPDATED = f"{DOMAIN}_state_updated_{{}}"
+EVENT_PROJECTOR_ERROR = f"{DOMAIN}_error"
 
 # Power states
 POWER_STATE_MAP = {
@@ -0,0 +1,71 @@
+"""Base entity for the per-setting Sony Projector ADCP entities."""
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+
+from .const import DOMAIN, SIGNAL_STATE_UPDATED
+from .runtime import SonyProjectorData
+from .state import ProjectorState
+
+
+class SonyProjectorSettingEntity(Entity):
+    """An entity for one projector setting.
+
+    State comes from the snapshot the media player polls, so these entities
+    never query the projector. Writes call the media player's service
+    methods, so they are validated and sent exactly like the services.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self, data: SonyProjectorData, entry_id: str, key: str, name: str
+    ) -> None:
+        """Initialize the entity."""
+        self._data = data
+        self._entry_id = entry_id
+        self._attr_unique_id = f"{entry_id}_{key}"
+        self._attr_name = name
+        self._attr_device_info = {"identifiers": {(DOMAIN, entry_id)}}
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to snapshot updates."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_STATE_UPDATED.format(self._entry_id),
+                self._async_state_updated,
+            )
+        )
+
+    @callback
+    def _async_state_updated(self) -> None:
+        """Write the new snapshot to the state machine."""
+        self.async_write_ha_state()
+
+    @property
+    def _snapshot(self) -> ProjectorState:
+        """Return the shared state snapshot."""
+        return self._data.state
+
+    @property
+    def available(self) -> bool:
+        """Return True while the projector is on and reachable."""
+        media_player = self._data.media_player
+        return (
+            media_player is not None
+            and media_player.available
+            and self._snapshot.is_on
+        )
+
+    async def _async_command(self, method: str, *args: Any) -> None:
+        """Run a media player service method."""
+        media_player = self._data.media_player
+        if media_player is None or media_player.hass is None:
+            raise HomeAssistantError("Projector is not ready")
+        await getattr(media_player, method)(*args)
+        media_player.async_write_ha_state()
@@ -1,6 +1,8 @@
 """Media Player entity for Sony Projector ADCP."""
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import Any, Optional
+import time
+from typing import Any, Dict, List, Optional
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
@@ -9,16 +11,31 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, async_get_current_platform
 import voluptuous as vol
 from homeassistant.helpers import config_validation as cv
-
-from .const import DEFAULT_NAME, DOMAIN, INPUT_SOURCES, PICTURE_MODES, POWER_STATE_MAP
-from .protocol import SonyProjectorADCP
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    CONF_PICTURE_RULES,
+    DEFAULT_NAME,
+    DOMAIN,
+    SCAN_INTERVAL as UPDATE_INTERVAL,
+    SIGNAL_STATE_UPDATED,
+    UPDATE_BUDGET,
+)
+from .picture_rules import RULE_SETTINGS, PictureRule, compile_rules
+from .response import is_error
+from .runtime import SonyProjectorData
+from .state import PARAMETER_FIELDS, POWERED_FIELDS, ProjectorState
 
 _LOGGER = logging.getLogger(__name__)
 
+# Polled explicitly so UPDATE_BUDGET always fits inside the interval
+SCAN_INTERVAL = timedelta(seconds=UPDATE_INTERVAL)
+
 # Service schemas
 SERVICE_SEND_KEY = "send_key"
 SERVICE_SET_PICTURE_MODE = "set_picture_mode"
@@ -27,11 +44,52 @@ SERVICE_SET_CONTRAST = "set_contrast"
 SERVICE_SET_SHARPNESS = "set_sharpness"
 SERVICE_SET_LIGHT_OUTPUT = "set_light_output"
 SERVICE_SEND_RAW_COMMAND = "send_raw_command"
+SERVICE_SEND_RAW_COMMANDS = "send_raw_commands"
+SERVICE_SET_PICTURE_RULES = "set_picture_rules"
 
 ATTR_KEY = "key"
 ATTR_MODE = "mode"
 ATTR_VALUE = "value"
+ATTR_TRANSITION = "transition"
 ATTR_COMMAND = "command"
+ATTR_COMMANDS = "commands"
+ATTR_RESPONSE = "response"
+ATTR_ERROR = "error"
+ATTR_RESULTS = "results"
+ATTR_RULES = "rules"
+
+ERROR_NO_RESPONSE = "no_response"
+
+MAX_TRANSITION = 3600  # seconds
+
+# Parameters read in one batch while the projector is on, most important first
+POLLED_PARAMETERS = tuple(
+    parameter for parameter in PARAMETER_FIELDS if parameter != "power_status"
+)
+
+# Fields that are kept while the projector is off
+KEPT_WHEN_OFF = ("input", "blank")
+
+NUMERIC_SERVICE_SCHEMA = {
+    vol.Required(ATTR_VALUE): vol.Coerce(int),
+    vol.Optional(ATTR_TRANSITION): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=MAX_TRANSITION)
+    ),
+}
+
+PICTURE_RULE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("name"): cv.string,
+        vol.Optional("input"): cv.string,
+        vol.Optional("hdr"): vol.All(cv.string, vol.Lower),
+        vol.Optional("min_frame_rate"): vol.Coerce(float),
+        vol.Optional("max_frame_rate"): vol.Coerce(float),
+        vol.Optional("min_height"): vol.Coerce(int),
+        vol.Optional("max_height"): vol.Coerce(int),
+        vol.Optional("picture_mode"): cv.string,
+        vol.Optional("settings"): {vol.In(RULE_SETTINGS): vol.Any(int, cv.string)},
+    }
+)
 
 KEY_COMMANDS = ["menu", "up", "down", "left", "right", "enter", "reset", "blank"]
 
@@ -42,10 +100,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Sony Projector media player."""
-    projector = hass.data[DOMAIN][config_entry.entry_id]
+    data = hass.data[DOMAIN][config_entry.entry_id]
     name = config_entry.data.get(CONF_NAME, DEFAULT_NAME)
-    
-    async_add_entities([SonyProjectorMediaPlayer(projector, name, config_entry.entry_id)])
+
+    # The number, select and switch entities write through this entity
+    data.media_player = SonyProjectorMediaPlayer(data, name, config_entry.entry_id)
+    async_add_entities([data.media_player])
     
     # Register services
     platform = async_get_current_platform()
@@ -58,31 +118,31 @@ async def async_setup_entry(
     
     platform.async_register_entity_service(
         SERVICE_SET_PICTURE_MODE,
-        {vol.Required(ATTR_MODE): vol.In(list(PICTURE_MODES.keys()))},
+        {vol.Required(ATTR_MODE): cv.string},
         "async_set_picture_mode_service",
     )
     
     platform.async_register_entity_service(
         SERVICE_SET_BRIGHTNESS,
-        {vol.Required(ATTR_VALUE): vol.All(vol.Coerce(int), vol.Range(min=0, max=100))},
+        NUMERIC_SERVICE_SCHEMA,
         "async_set_brightness",
     )
     
     platform.async_register_entity_service(
         SERVICE_SET_CONTRAST,
-        {vol.Required(ATTR_VALUE): vol.All(vol.Coerce(int), vol.Range(min=0, max=100))},
+        NUMERIC_SERVICE_SCHEMA,
         "async_set_contrast",
     )
     
     platform.async_register_entity_service(
         SERVICE_SET_SHARPNESS,
-        {vol.Required(ATTR_VALUE): vol.All(vol.Coerce(int), vol.Range(min=0, max=100))},
+        NUMERIC_SERVICE_SCHEMA,
         "async_set_sharpness",
     )
     
     platform.async_register_entity_service(
         SERVICE_SET_LIGHT_OUTPUT,
-        {vol.Required(ATTR_VALUE): vol.All(vol.Coerce(int), vol.Range(min=0, max=100))},
+        NUMERIC_SERVICE_SCHEMA,
         "async_set_light_output",
     )
     
@@ -151,6 +211,23 @@ async def async_setup_entry(
         {vol.Required(ATTR_COMMAND): str},
         "async_send_raw_command",
     )
+    
+    platform.async_register_entity_service(
+        SERVICE_SEND_RAW_COMMANDS,
+        {
+            vol.Required(ATTR_COMMANDS): vol.All(
+                cv.ensure_list, [cv.string], vol.Length(min=1)
+            )
+        },
+        "async_send_raw_commands",
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    platform.async_register_entity_service(
+        SERVICE_SET_PICTURE_RULES,
+        {vol.Required(ATTR_RULES): vol.All(cv.ensure_list, [PICTURE_RULE_SCHEMA])},
+        "async_set_picture_rules",
+    )
 
 
 class SonyProjectorMediaPlayer(MediaPlayerEntity):
@@ -164,120 +241,133 @@ class SonyProjectorMediaPlayer(MediaPlayerEntity):
         | MediaPlayerEntityFeature.SELECT_SOURCE
     )
 
-    def __init__(
-        self, projector: SonyProjectorADCP, name: str, entry_id: str
-    ) -> None:
+    def __init__(self, data: SonyProjectorData, name: str, entry_id: str) -> None:
         """Initialize the media player."""
-        self._projector = projector
+        self._data = data
+        self._projector = data.projector
+        self._transitions = data.transitions
+        self._picture_rules = data.picture_rules
+        self._entry_id = entry_id
+        self._profile = data.projector.profile
         self._attr_unique_id = f"{entry_id}_media_player"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, entry_id)},
             "name": name,
             "manufacturer": "Sony",
-            "model": "VPL-XW5000",
+            "model": self._profile.name,
         }
         self._attr_state = MediaPlayerState.OFF
-        self._current_source = None
-        self._is_blank = False
-        self._picture_mode = None
-        self._brightness = None
-        self._contrast = None
-        self._sharpness = None
-        self._light_output = None
-        self._reality_creation = None
+        self._polled = [p for p in POLLED_PARAMETERS if self._profile.supports(p)]
+        # Parameters that missed the last update's budget, read first next time
+        self._carried: List[str] = []
+        # Wall time each field was last read from the projector
+        self._field_updated: Dict[str, float] = {}
+
+    @property
+    def projector_state(self) -> ProjectorState:
+        """Return the current state snapshot."""
+        return self._state
+
+    @property
+    def _state(self) -> ProjectorState:
+        """Return the shared state snapshot."""
+        return self._data.state
+
+    @_state.setter
+    def _state(self, state: ProjectorState) -> None:
+        """Replace the shared snapshot and notify the setting entities."""
+        if state is self._data.state:
+            return
+        self._data.state = state
+        self._async_publish_state()
+
+    @callback
+    def _async_publish_state(self) -> None:
+        """Tell the setting entities that the snapshot or availability changed."""
+        if self.hass is not None:
+            async_dispatcher_send(
+                self.hass, SIGNAL_STATE_UPDATED.format(self._entry_id)
+            )
 
     async def async_update(self) -> None:
-        """Update the state of the projector."""
+        """Update the state of the projector within UPDATE_BUDGET seconds.
+
+        Fields that do not answer in time keep their last value and are read
+        first on the next update.
+        """
+        deadline = time.monotonic() + UPDATE_BUDGET
         try:
-            # Get power status
-            power_status = await self._projector.get_power_status()
+            # Get power status - keep last value if query fails
+            state = self._state
+            values = await self._projector.query_many(("power_status",), UPDATE_BUDGET)
+            power_status = values.get("power_status")
             if power_status:
-                self._attr_state = (
-                    MediaPlayerState.ON
-                    if POWER_STATE_MAP.get(power_status) == "on"
-                    else MediaPlayerState.OFF
+                state = state.replace(power=power_status)
+                self._field_updated["power"] = time.time()
+
+            if state.is_on:
+                # Read everything else in one batch, keeping the last value
+                # of any field whose query fails or misses the deadline
+                carried = self._carried
+                order = carried + [p for p in self._polled if p not in carried]
+                remaining = deadline - time.monotonic()
+                values = (
+                    await self._projector.query_many(order, remaining)
+                    if remaining > 0
+                    else {}
                 )
-            
-            # Get additional info if powered on
-            if self._attr_state == MediaPlayerState.ON:
-                # Get input source
-                try:
-                    source = await self._projector.get_input()
-                    if source:
-                        self._current_source = source
-                except Exception as e:
-                    _LOGGER.debug("Error getting input source: %s", e)
-                
-                # Get blank status
-                try:
-                    blank_status = await self._projector.get_blank_status()
-                    if blank_status is not None:
-                        self._is_blank = blank_status
-                except Exception as e:
-                    _LOGGER.debug("Error getting blank status: %s", e)
-                
-                # Get picture mode - keep last value if query fails
-                try:
-                    picture_mode = await self._projector.get_picture_mode()
-                    if picture_mode:
-                        self._picture_mode = picture_mode
-                except Exception as e:
-                    _LOGGER.debug("Error getting picture mode: %s", e)
-                
-                # Get brightness - keep last value if query fails
-                try:
-                    brightness = await self._projector.get_numeric_value("brightness")
-                    if brightness is not None:
-                        self._brightness = brightness
-                except Exception as e:
-                    _LOGGER.debug("Error getting brightness: %s", e)
-                
-                # Get contrast - keep last value if query fails
-                try:
-                    contrast = await self._projector.get_numeric_value("contrast")
-                    if contrast is not None:
-                        self._contrast = contrast
-                except Exception as e:
-                    _LOGGER.debug("Error getting contrast: %s", e)
-                
-                # Get sharpness - keep last value if query fails
-                try:
-                    sharpness = await self._projector.get_numeric_value("sharpness")
-                    if sharpness is not None:
-                        self._sharpness = sharpness
-                except Exception as e:
-                    _LOGGER.debug("Error getting sharpness: %s", e)
-                
-                # Get light output - keep last value if query fails
-                try:
-                    light_output = await self._projector.get_numeric_value("light_output_val")
-                    if light_output is not None:
-                        self._light_output = light_output
-                except Exception as e:
-                    _LOGGER.debug("Error getting light output: %s", e)
-                
-                # Get reality creation - keep last value if query fails
-                try:
-                    reality_creation = await self._projector.get_reality_creation()
-                    if reality_creation:
-                        self._reality_creation = reality_creation
-                except Exception as e:
-                    _LOGGER.debug("Error getting reality creation: %s", e)
+                now = time.time()
+                self._carried = [p for p in order if p not in values]
+                if self._carried:
+                    _LOGGER.debug(
+                        "Update budget spent, carrying over %s", self._carried
+                    )
+                changes = {}
+                for parameter, value in values.items():
+                    # Error codes and undecodable values keep their age
+                    if value is not None:
+                        field = PARAMETER_FIELDS[parameter]
+                        changes[field] = value
+                        self._field_updated[field] = now
+                state = state.replace(**changes)
             else:
-                # If powered off, clear these values
-                self._brightness = None
-                self._contrast = None
-                self._sharpness = None
-                self._light_output = None
-                self._picture_mode = None
-                self._reality_creation = None
-                    
+                # If powered off, clear the picture values
+                self._carried = []
+                for field in POWERED_FIELDS:
+                    if field not in KEPT_WHEN_OFF:
+                        self._field_updated.pop(field, None)
+                state = state.replace(
+                    **{
+                        field: None
+                        for field in POWERED_FIELDS
+                        if field not in KEPT_WHEN_OFF
+                    }
+                )
+
         except Exception as e:
             _LOGGER.error("Error updating projector state: %s", e)
-            self._attr_available = False
+            if self._attr_available:
+                self._attr_available = False
+                self._async_publish_state()
             return
-        
+
+        previous = self._state
+        if previous.power is not None and state.is_on and (
+            not previous.is_on or previous.input != state.input
+        ):
+            # Powered on or switched input outside Home Assistant
+            self._async_trigger_picture_rules()
+
+        # Availability goes first so the setting entities read it with the
+        # new snapshot
+        was_available = self._attr_available
         self._attr_available = True
+        self._attr_state = (
+            MediaPlayerState.ON if state.is_on else MediaPlayerState.OFF
+        )
+        if state is self._state and not was_available:
+            self._async_publish_state()
+        self._state = state
 
     async def async_turn_on(self) -> None:
         """Turn the projector on."""
@@ -290,111 +380,181 @@ class SonyProjectorMediaPlayer(MediaPlayerEntity):
     async def async_select_source(self, source: str) -> None:
         """Select input source."""
         source_key = None
-        for key, name in INPUT_SOURCES.items():
+        for key, name in self._profile.inputs.items():
             if name == source:
                 source_key = key
                 break
         
         if source_key:
             await self._projector.set_input(source_key)
-            self._current_source = source_key
+            self._state = self._state.replace(input=source_key)
+            if self._state.is_on:
+                self._async_trigger_picture_rules()
+
+    @callback
+    def _async_trigger_picture_rules(self) -> None:
+        """Read the new signal on the fast tier and apply the matching rule."""
+
+        @callback
+        def _async_applied(rule: PictureRule, changes: dict[str, Any]) -> None:
+            self._state = self._state.replace(
+                **{
+                    PARAMETER_FIELDS[parameter]: value
+                    for parameter, value in changes.items()
+                    if parameter in PARAMETER_FIELDS
+                }
+            )
+            self.async_write_ha_state()
+
+        self._picture_rules.trigger(_async_applied)
+
+    async def async_set_picture_rules(self, rules: list[dict[str, Any]]) -> None:
+        """Replace the picture rules and store them in the entry options."""
+        try:
+            compiled = compile_rules(rules, self._profile)
+        except ValueError as e:
+            raise HomeAssistantError(str(e)) from e
+
+        self._picture_rules.rules = compiled
+        entry = self.hass.config_entries.async_get_entry(self._entry_id)
+        self.hass.config_entries.async_update_entry(
+            entry, options={**entry.options, CONF_PICTURE_RULES: rules}
+        )
+        if self._state.is_on:
+            self._async_trigger_picture_rules()
+
+    async def async_set_blank(self, state: bool) -> None:
+        """Blank or unblank the picture."""
+        if await self._projector.set_blank(state):
+            self._state = self._state.replace(blank="on" if state else "off")
+        else:
+            _LOGGER.error("Failed to set blank to %s", state)
 
     async def async_send_key(self, key: str) -> None:
         """Send a remote control key command."""
         await self._projector.send_key(key)
 
+    def _validate(self, parameter: str, value: Any) -> Any:
+        """Validate a service value against the model profile."""
+        try:
+            return self._profile.parameter(parameter).validate(value)
+        except ValueError as e:
+            raise HomeAssistantError(str(e)) from e
+
+    def _step(self, parameter: str, current: Optional[int], delta: int) -> int:
+        """Return current + delta clamped to the profile range."""
+        spec = self._profile.parameter(parameter)
+        if current is None:
+            current = spec.midpoint
+        return spec.clamp(current + delta)
+
+    async def _async_set_numeric(
+        self, parameter: str, value: int, transition: Optional[float] = None
+    ) -> None:
+        """Set a numeric parameter, optionally fading to it over transition seconds."""
+        value = self._validate(parameter, value)
+        field = PARAMETER_FIELDS[parameter]
+
+        if transition:
+            start = getattr(self._state, field)
+            if start is None:
+                start = await self._projector.get_numeric_value(parameter)
+            if start is not None and start != value:
+
+                @callback
+                def _async_step(step: int, done: bool) -> None:
+                    self._state = self._state.replace(**{field: step})
+                    if done:
+                        self.async_write_ha_state()
+
+                self._transitions.start(parameter, start, value, transition, _async_step)
+                return
+
+        self._transitions.cancel(parameter)
+        await self._projector.set_numeric_value(parameter, value)
+        self._state = self._state.replace(**{field: value})
+
     async def async_set_picture_mode_service(self, mode: str) -> None:
         """Set picture mode via service call."""
+        mode = self._validate("picture_mode", mode)
         await self._projector.set_picture_mode(mode)
-        self._picture_mode = mode
+        self._state = self._state.replace(picture_mode=mode)
 
-    async def async_set_brightness(self, value: int) -> None:
+    async def async_set_brightness(
+        self, value: int, transition: Optional[float] = None
+    ) -> None:
         """Set brightness via service call."""
-        await self._projector.set_numeric_value("brightness", value)
-        self._brightness = value
+        await self._async_set_numeric("brightness", value, transition)
 
-    async def async_set_contrast(self, value: int) -> None:
+    async def async_set_contrast(
+        self, value: int, transition: Optional[float] = None
+    ) -> None:
         """Set contrast via service call."""
-        await self._projector.set_numeric_value("contrast", value)
-        self._contrast = value
+        await self._async_set_numeric("contrast", value, transition)
 
-    async def async_set_sharpness(self, value: int) -> None:
+    async def async_set_sharpness(
+        self, value: int, transition: Optional[float] = None
+    ) -> None:
         """Set sharpness via service call."""
-        await self._projector.set_numeric_value("sharpness", value)
-        self._sharpness = value
+        await self._async_set_numeric("sharpness", value, transition)
 
-    async def async_set_light_output(self, value: int) -> None:
+    async def async_set_light_output(
+        self, value: int, transition: Optional[float] = None
+    ) -> None:
         """Set light output via service call."""
-        await self._projector.set_numeric_value("light_output_val", value)
-        self._light_output = value
+        await self._async_set_numeric("light_output_val", value, transition)
 
     async def async_increase_brightness(self) -> None:
         """Increase brightness by 1."""
-        current = self._brightness if self._brightness is not None else 50
-        new_value = min(current + 1, 100)
-        await self._projector.set_numeric_value("brightness", new_value)
-        self._brightness = new_value
+        new_value = self._step("brightness", self._state.brightness, 1)
+        await self._async_set_numeric("brightness", new_value)
 
     async def async_decrease_brightness(self) -> None:
         """Decrease brightness by 1."""
-        current = self._brightness if self._brightness is not None else 50
-        new_value = max(current - 1, 0)
-        await self._projector.set_numeric_value("brightness", new_value)
-        self._brightness = new_value
+        new_value = self._step("brightness", self._state.brightness, -1)
+        await self._async_set_numeric("brightness", new_value)
 
     async def async_increase_contrast(self) -> None:
         """Increase contrast by 1."""
-        current = self._contrast if self._contrast is not None else 50
-        new_value = min(current + 1, 100)
-        await self._projector.set_numeric_value("contrast", new_value)
-        self._contrast = new_value
+        new_value = self._step("contrast", self._state.contrast, 1)
+        await self._async_set_numeric("contrast", new_value)
 
     async def async_decrease_contrast(self) -> None:
         """Decrease contrast by 1."""
-        current = self._contrast if self._contrast is not None else 50
-        new_value = max(current - 1, 0)
-        await self._projector.set_numeric_value("contrast", new_value)
-        self._contrast = new_value
+        new_value = self._step("contrast", self._state.contrast, -1)
+        await self._async_set_numeric("contrast", new_value)
 
     async def async_increase_sharpness(self) -> None:
         """Increase sharpness by 1."""
-        current = self._sharpness if self._sharpness is not None else 50
-        new_value = min(current + 1, 100)
-        await self._projector.set_numeric_value("sharpness", new_value)
-        self._sharpness = new_value
+        new_value = self._step("sharpness", self._state.sharpness, 1)
+        await self._async_set_numeric("sharpness", new_value)
 
     async def async_decrease_sharpness(self) -> None:
         """Decrease sharpness by 1."""
-        current = self._sharpness if self._sharpness is not None else 50
-        new_value = max(current - 1, 0)
-        await self._projector.set_numeric_value("sharpness", new_value)
-        self._sharpness = new_value
+        new_value = self._step("sharpness", self._state.sharpness, -1)
+        await self._async_set_numeric("sharpness", new_value)
 
     async def async_increase_light_output(self) -> None:
         """Increase light output by 1."""
-        current = self._light_output if self._light_output is not None else 50
-        new_value = min(current + 1, 100)
-        await self._projector.set_numeric_value("light_output_val", new_value)
-        self._light_output = new_value
+        new_value = self._step("light_output_val", self._state.light_output, 1)
+        await self._async_set_numeric("light_output_val", new_value)
 
     async def async_decrease_light_output(self) -> None:
         """Decrease light output by 1."""
-        current = self._light_output if self._light_output is not None else 50
-        new_value = max(current - 1, 0)
-        await self._projector.set_numeric_value("light_output_val", new_value)
-        self._light_output = new_value
+        new_value = self._step("light_output_val", self._state.light_output, -1)
+        await self._async_set_numeric("light_output_val", new_value)
 
     async def async_set_reality_creation(self, state: str) -> None:
         """Set Reality Creation on or off."""
         success = await self._projector.set_reality_creation(state)
         if success:
-            self._reality_creation = state
+            self._state = self._state.replace(reality_creation=state)
         else:
             _LOGGER.error("Failed to set reality creation to %s", state)
 
     async def async_toggle_reality_creation(self) -> None:
         """Toggle Reality Creation on/off."""
-        current = self._reality_creation if self._reality_creation else "off"
+        current = self._state.reality_creation or "off"
         new_state = "off" if current == "on" else "on"
         await self.async_set_reality_creation(new_state)
 
@@ -406,41 +566,81 @@ class SonyProjectorMediaPlayer(MediaPlayerEntity):
         else:
             _LOGGER.error("Raw command '%s' failed", command)
 
+    async def async_send_raw_commands(self, commands: list[str]) -> dict[str, Any]:
+        """Send a batch of raw ADCP commands and return every response."""
+        responses = await self._projector.send_batch(commands)
+
+        results = []
+        for command, response in zip(commands, responses):
+            if response is None:
+                results.append({ATTR_COMMAND: command, ATTR_ERROR: ERROR_NO_RESPONSE})
+            elif is_error(response):
+                results.append({ATTR_COMMAND: command, ATTR_ERROR: response})
+            else:
+                results.append({ATTR_COMMAND: command, ATTR_RESPONSE: response})
+
+        return {ATTR_RESULTS: results}
+
     @property
     def source(self) -> Optional[str]:
         """Return the current input source."""
-        if self._current_source:
-            return INPUT_SOURCES.get(self._current_source)
+        if self._state.input:
+            return self._profile.inputs.get(self._state.input)
         return None
 
     @property
     def source_list(self) -> list[str]:
         """List of available input sources."""
-        return list(INPUT_SOURCES.values())
+        return list(self._profile.inputs.values())
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
+        state = self._state
         attrs = {
-            "video_muted": self._is_blank,
+            "video_muted": state.blank == "on",
         }
         
-        if self._picture_mode:
-            attrs["picture_mode"] = PICTURE_MODES.get(self._picture_mode, self._picture_mode)
+        if state.picture_mode:
+            attrs["picture_mode"] = self._profile.picture_modes.get(
+                state.picture_mode, state.picture_mode
+            )
         
-        if self._brightness is not None:
-            attrs["brightness"] = self._brightness
+        if state.brightness is not None:
+            attrs["brightness"] = state.brightness
         
-        if self._contrast is not None:
-            attrs["contrast"] = self._contrast
+        if state.contrast is not None:
+            attrs["contrast"] = state.contrast
         
-        if self._sharpness is not None:
-            attrs["sharpness"] = self._sharpness
+        if state.sharpness is not None:
+            attrs["sharpness"] = state.sharpness
         
-        if self._light_output is not None:
-            attrs["light_output"] = self._light_output
+        if state.light_output is not None:
+            attrs["light_output"] = state.light_output
         
-        if self._reality_creation is not None:
-            attrs["reality_creation"] = self._reality_creation
+        if state.reality_creation is not None:
+            attrs["reality_creation"] = state.reality_creation
+
+        picture_rules = self._picture_rules
+        if picture_rules.signal is not None:
+            attrs["signal"] = picture_rules.signal.raw
+            if picture_rules.signal.hdr is not None:
+                attrs["hdr_format"] = picture_rules.signal.hdr
+        if picture_rules.applied is not None:
+            attrs["picture_rule"] = picture_rules.applied.name
+
+        # Only stale fields get a read time, so the attributes (and the
+        # recorder rows) do not change on every poll
+        stale_fields = [PARAMETER_FIELDS[parameter] for parameter in self._carried]
+        attrs["stale_fields"] = stale_fields
+        stale_since = {
+            field: datetime.fromtimestamp(
+                self._field_updated[field], timezone.utc
+            ).isoformat()
+            for field in stale_fields
+            if field in self._field_updated
+        }
+        if stale_since:
+            attrs["stale_since"] = stale_since
         
-        return attrs
\ No newline at end of file
+        return attrs
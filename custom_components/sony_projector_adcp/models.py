@@ -0,0 +1,243 @@
+"""Data-driven projector model profiles for Sony Projector ADCP.
+
+Each supported model family is described by a JSON file in the ``profiles``
+directory. A profile declares the ADCP parameters the model understands,
+their value ranges and enum values. Profiles are compiled once into
+pre-encoded byte commands and response decoders, so nothing has to be
+formatted or encoded again when the projector is polled.
+"""
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from .response import typed_decoder
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_DIR = os.path.join(os.path.dirname(__file__), "profiles")
+PROFILE_SUFFIX = ".json"
+
+NEWLINE = b"\r\n"
+ENCODING = "ascii"
+
+TYPE_ENUM = "enum"
+TYPE_INT = "int"
+TYPE_STRING = "string"
+TYPE_JSON = "json"
+
+_PROFILE_CACHE: Dict[str, "ModelProfile"] = {}
+
+_DECODE_STRING = typed_decoder(str)
+_DECODE_INT = typed_decoder(int)
+_DECODE_JSON = typed_decoder(list, dict)
+
+
+class ParameterSpec:
+    """A compiled ADCP parameter with pre-encoded commands."""
+
+    __slots__ = (
+        "name",
+        "kind",
+        "values",
+        "minimum",
+        "maximum",
+        "query",
+        "decode",
+        "_set_commands",
+        "_set_prefix",
+    )
+
+    def __init__(self, name: str, definition: Dict[str, Any]) -> None:
+        """Compile a parameter definition."""
+        self.name = name
+        self.kind = definition.get("type", TYPE_ENUM)
+        self.values: Dict[str, str] = dict(definition.get("values", {}))
+        self.minimum: Optional[int] = definition.get("min")
+        self.maximum: Optional[int] = definition.get("max")
+
+        readable = definition.get("readable", True)
+        writable = definition.get("writable", True)
+
+        self.query: Optional[bytes] = (
+            f"{name} ?".encode(ENCODING) + NEWLINE if readable else None
+        )
+        self._set_commands: Dict[str, bytes] = {}
+        self._set_prefix: Optional[bytes] = None
+
+        if self.kind == TYPE_INT:
+            self.decode: Callable[[Optional[str]], Any] = _DECODE_INT
+            if writable:
+                self._set_prefix = f"{name} ".encode(ENCODING)
+        elif self.kind == TYPE_JSON:
+            self.decode = _DECODE_JSON
+        else:
+            self.decode = _DECODE_STRING
+            if writable:
+                self._set_commands = {
+                    value: f'{name} "{value}"'.encode(ENCODING) + NEWLINE
+                    for value in self.values
+                }
+
+    @property
+    def readable(self) -> bool:
+        """Return True if the parameter can be queried."""
+        return self.query is not None
+
+    @property
+    def writable(self) -> bool:
+        """Return True if the parameter can be set."""
+        return bool(self._set_commands) or self._set_prefix is not None
+
+    def validate(self, value: Any) -> Any:
+        """Return value if it is accepted by this parameter, else raise ValueError."""
+        if self.kind == TYPE_INT:
+            value = int(value)
+            if self.minimum is not None and value < self.minimum:
+                raise ValueError(f"{self.name} must be >= {self.minimum}, got {value}")
+            if self.maximum is not None and value > self.maximum:
+                raise ValueError(f"{self.name} must be <= {self.maximum}, got {value}")
+            return value
+        if value not in self._set_commands:
+            raise ValueError(f"Unsupported value for {self.name}: {value}")
+        return value
+
+    def encode_set(self, value: Any) -> bytes:
+        """Return the pre-encoded command that sets this parameter to value."""
+        if not self.writable:
+            raise ValueError(f"Parameter {self.name} is read-only")
+        value = self.validate(value)
+        if self._set_prefix is not None:
+            return self._set_prefix + str(value).encode(ENCODING) + NEWLINE
+        return self._set_commands[value]
+
+    def clamp(self, value: int) -> int:
+        """Clamp a numeric value into the parameter range."""
+        if self.minimum is not None:
+            value = max(value, self.minimum)
+        if self.maximum is not None:
+            value = min(value, self.maximum)
+        return value
+
+    @property
+    def midpoint(self) -> int:
+        """Return the middle of the numeric range."""
+        return ((self.minimum or 0) + (self.maximum or 100)) // 2
+
+
+class ModelProfile:
+    """A compiled projector model profile."""
+
+    def __init__(self, key: str, definition: Dict[str, Any]) -> None:
+        """Compile a merged profile definition."""
+        self.key = key
+        self.name: str = definition.get("name", key)
+        self.models: List[str] = list(definition.get("models", []))
+        self.parameters: Dict[str, ParameterSpec] = {
+            name: ParameterSpec(name, param)
+            for name, param in definition.get("parameters", {}).items()
+        }
+        self.telemetry: Dict[str, Dict[str, Any]] = dict(
+            definition.get("telemetry", {})
+        )
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"<ModelProfile {self.key}>"
+
+    def supports(self, parameter: str) -> bool:
+        """Return True if the profile declares parameter."""
+        return parameter in self.parameters
+
+    def parameter(self, parameter: str) -> ParameterSpec:
+        """Return the compiled spec for parameter."""
+        try:
+            return self.parameters[parameter]
+        except KeyError:
+            raise ValueError(
+                f"Parameter {parameter} is not supported by {self.name}"
+            ) from None
+
+    def enum_values(self, parameter: str) -> Dict[str, str]:
+        """Return the enum values and labels for parameter, if supported."""
+        spec = self.parameters.get(parameter)
+        return spec.values if spec else {}
+
+    @property
+    def inputs(self) -> Dict[str, str]:
+        """Return the supported input sources."""
+        return self.enum_values("input")
+
+    @property
+    def picture_modes(self) -> Dict[str, str]:
+        """Return the supported picture modes."""
+        return self.enum_values("picture_mode")
+
+    def matches(self, model_name: str) -> bool:
+        """Return True if model_name belongs to this profile."""
+        model_name = model_name.upper()
+        return any(model_name.startswith(model.upper()) for model in self.models)
+
+
+def _read_definition(key: str, seen: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Read a profile file and merge it over the profile it extends."""
+    seen = seen or []
+    if key in seen:
+        raise ValueError(f"Circular profile inheritance: {' -> '.join(seen + [key])}")
+
+    path = os.path.join(PROFILE_DIR, f"{key}{PROFILE_SUFFIX}")
+    with open(path, encoding="utf-8") as profile_file:
+        definition = json.load(profile_file)
+
+    base_key = definition.pop("extends", None)
+    if not base_key:
+        return definition
+
+    merged = _read_definition(base_key, seen + [key])
+    for section in ("parameters", "telemetry"):
+        entries = dict(merged.get(section, {}))
+        entries.update(definition.pop(section, {}))
+        merged[section] = entries
+    merged.update(definition)
+    return merged
+
+
+def available_profiles() -> Dict[str, str]:
+    """Return the profile keys and display names found on disk.
+
+    This reads from disk and must be run in an executor from the event loop.
+    """
+    profiles = {}
+    for filename in sorted(os.listdir(PROFILE_DIR)):
+        if not filename.endswith(PROFILE_SUFFIX):
+            continue
+        key = filename[: -len(PROFILE_SUFFIX)]
+        try:
+            profiles[key] = load_profile(key).name
+        except (OSError, ValueError) as e:
+            _LOGGER.error("Invalid projector profile %s: %s", filename, e)
+    return profiles
+
+
+def load_profile(key: str) -> ModelProfile:
+    """Load and compile a profile, caching the result.
+
+    This reads from disk and must be run in an executor from the event loop.
+    """
+    profile = _PROFILE_CACHE.get(key)
+    if profile is None:
+        profile = ModelProfile(key, _read_definition(key))
+        _PROFILE_CACHE[key] = profile
+    return profile
+
+
+def find_profile(model_name: str) -> Optional[ModelProfile]:
+    """Return the profile that declares model_name, if any.
+
+    This reads from disk and must be run in an executor from the event loop.
+    """
+    for key in available_profiles():
+        profile = load_profile(key)
+        if profile.matches(model_name):
+            return profile
+    return None
@@ -0,0 +1,80 @@
+"""Number entities for Sony Projector ADCP picture adjustments."""
+import logging
+from typing import Optional
+
+from homeassistant.components.number import NumberEntity, NumberMode
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .entity import SonyProjectorSettingEntity
+from .runtime import SonyProjectorData
+from .state import PARAMETER_FIELDS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Parameter, name, icon and the media player method that sets it
+NUMBERS = (
+    ("brightness", "Brightness", "mdi:brightness-6", "async_set_brightness"),
+    ("contrast", "Contrast", "mdi:contrast-box", "async_set_contrast"),
+    ("sharpness", "Sharpness", "mdi:image-filter-center-focus", "async_set_sharpness"),
+    (
+        "light_output_val",
+        "Light output",
+        "mdi:lightbulb-on-outline",
+        "async_set_light_output",
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Sony Projector number entities."""
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    profile = data.projector.profile
+
+    async_add_entities(
+        SonyProjectorNumber(data, config_entry.entry_id, *number)
+        for number in NUMBERS
+        if profile.supports(number[0]) and profile.parameter(number[0]).writable
+    )
+
+
+class SonyProjectorNumber(SonyProjectorSettingEntity, NumberEntity):
+    """A numeric picture adjustment."""
+
+    _attr_mode = NumberMode.SLIDER
+    _attr_native_step = 1
+
+    def __init__(
+        self,
+        data: SonyProjectorData,
+        entry_id: str,
+        parameter: str,
+        name: str,
+        icon: str,
+        method: str,
+    ) -> None:
+        """Initialize the number."""
+        field = PARAMETER_FIELDS[parameter]
+        super().__init__(data, entry_id, field, name)
+        self._field = field
+        self._method = method
+        self._attr_icon = icon
+
+        spec = data.projector.profile.parameter(parameter)
+        self._attr_native_min_value = spec.minimum if spec.minimum is not None else 0
+        self._attr_native_max_value = spec.maximum if spec.maximum is not None else 100
+
+    @property
+    def native_value(self) -> Optional[int]:
+        """Return the current value."""
+        return getattr(self._snapshot, self._field)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set a new value."""
+        await self._async_command(self._method, int(value))
@@ -0,0 +1,320 @@
+"""Signal-aware automatic picture mode switching.
+
+Rules map characteristics of the incoming signal (HDR format, frame rate,
+resolution, input) to a picture mode and picture settings. The signal is
+only read on a fast tier that runs for a short window after an input change
+or power-on: ``signal`` and ``hdr_format`` are polled every
+SIGNAL_POLL_INTERVAL seconds until the projector has locked on to the new
+signal, and the first matching rule is applied with one pipelined batch of
+pre-encoded set commands.
+
+Rules are plain dicts so they can be stored in the config entry options::
+
+    {"name": "HDR movies", "hdr": "hdr", "max_frame_rate": 30,
+     "picture_mode": "cinema_film2", "settings": {"real_cre": "off"}}
+"""
+import asyncio
+import logging
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .const import (
+    POWER_STATE_MAP,
+    SIGNAL_POLL_INTERVAL,
+    SIGNAL_SETTLE,
+    SIGNAL_WINDOW,
+)
+from .models import ModelProfile
+from .protocol import SonyProjectorADCP
+from .response import is_error
+from .state import PARAMETER_FIELDS
+
+_LOGGER = logging.getLogger(__name__)
+
+HDR_ANY = "hdr"
+HDR_SDR = "sdr"
+# hdr_format values that mean the signal is not HDR
+SDR_FORMATS = ("sdr", "off")
+
+RULE_KEYS = (
+    "name",
+    "input",
+    "hdr",
+    "min_frame_rate",
+    "max_frame_rate",
+    "min_height",
+    "max_height",
+    "picture_mode",
+    "settings",
+)
+
+# Parameters a rule may set under settings: the polled picture adjustments.
+# The picture mode has its own key; power, input and blanking are not
+# picture settings.
+RULE_SETTINGS = tuple(
+    parameter
+    for parameter in PARAMETER_FIELDS
+    if parameter not in ("power_status", "input", "blank", "picture_mode")
+)
+
+# For example "3840x2160/24p", "1920x1080p/59.94" or "1080/60i"
+_SIGNAL_PATTERN = re.compile(
+    r"^(?:(?P<width>\d+)x)?(?P<height>\d+)(?P<scan>[pi])?"
+    r"/(?P<rate>\d+(?:\.\d+)?)(?P<rate_scan>[pi])?$"
+)
+
+AppliedCallback = Callable[["PictureRule", Dict[str, Any]], None]
+
+
+class SignalInfo(NamedTuple):
+    """Characteristics of the incoming video signal."""
+
+    raw: str
+    height: int
+    frame_rate: float
+    hdr: Optional[str]
+
+
+def parse_signal(signal: Any, hdr_format: Any = None) -> Optional[SignalInfo]:
+    """Parse the signal and hdr_format responses, or None without a valid signal."""
+    if not isinstance(signal, str):
+        return None
+    match = _SIGNAL_PATTERN.match(signal.replace(" ", "").lower())
+    if match is None:
+        return None
+
+    hdr = None
+    if isinstance(hdr_format, str):
+        hdr = HDR_SDR if hdr_format.lower() in SDR_FORMATS else hdr_format.lower()
+    return SignalInfo(signal, int(match["height"]), float(match["rate"]), hdr)
+
+
+class PictureRule:
+    """A compiled picture rule."""
+
+    __slots__ = (
+        "name",
+        "input",
+        "hdr",
+        "min_frame_rate",
+        "max_frame_rate",
+        "min_height",
+        "max_height",
+        "changes",
+        "commands",
+    )
+
+    def __init__(self, definition: Dict[str, Any], profile: ModelProfile) -> None:
+        """Compile a rule, raising ValueError if the profile cannot apply it."""
+        if not isinstance(definition, dict):
+            raise ValueError("A rule must be a mapping")
+        unknown = set(definition) - set(RULE_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown rule keys: {', '.join(sorted(unknown))}")
+
+        self.input: Optional[str] = definition.get("input")
+        if self.input is not None:
+            profile.parameter("input").validate(self.input)
+        hdr = definition.get("hdr")
+        self.hdr: Optional[str] = None if hdr is None else str(hdr).lower()
+        self.min_frame_rate = _optional(definition, "min_frame_rate", float)
+        self.max_frame_rate = _optional(definition, "max_frame_rate", float)
+        self.min_height = _optional(definition, "min_height", int)
+        self.max_height = _optional(definition, "max_height", int)
+
+        settings = definition.get("settings", {})
+        if not isinstance(settings, dict):
+            raise ValueError("settings must be a mapping of parameter to value")
+        for parameter in settings:
+            if parameter not in RULE_SETTINGS:
+                raise ValueError(
+                    f"{parameter} is not a picture setting; "
+                    f"use one of {', '.join(RULE_SETTINGS)}"
+                )
+            spec = profile.parameter(parameter)
+            if not (spec.readable and spec.writable):
+                raise ValueError(f"{parameter} cannot be read and set on this model")
+
+        # Picture mode goes first so the settings land on the new mode. Values
+        # are stored as validated, e.g. "70" becomes 70 for int parameters.
+        self.changes: Dict[str, Any] = {}
+        if "picture_mode" in definition:
+            self.changes["picture_mode"] = definition["picture_mode"]
+        self.changes.update(settings)
+        if not self.changes:
+            raise ValueError("A rule needs a picture_mode or settings")
+        self.changes = {
+            parameter: profile.parameter(parameter).validate(value)
+            for parameter, value in self.changes.items()
+        }
+
+        self.commands: List[bytes] = [
+            profile.parameter(parameter).encode_set(value)
+            for parameter, value in self.changes.items()
+        ]
+        self.name: str = definition.get("name") or ", ".join(
+            f"{parameter}={value}" for parameter, value in self.changes.items()
+        )
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"<PictureRule {self.name}>"
+
+    def matches(self, signal: SignalInfo, input_source: Optional[str]) -> bool:
+        """Return True if this rule applies to signal on input_source."""
+        if self.input is not None and self.input != input_source:
+            return False
+        if self.hdr is not None:
+            if signal.hdr is None:
+                return False
+            if self.hdr == HDR_ANY:
+                if signal.hdr == HDR_SDR:
+                    return False
+            elif self.hdr != signal.hdr:
+                return False
+        if self.min_frame_rate is not None and signal.frame_rate < self.min_frame_rate:
+            return False
+        if self.max_frame_rate is not None and signal.frame_rate > self.max_frame_rate:
+            return False
+        if self.min_height is not None and signal.height < self.min_height:
+            return False
+        if self.max_height is not None and signal.height > self.max_height:
+            return False
+        return True
+
+
+def _optional(definition: Dict[str, Any], key: str, kind: type) -> Any:
+    """Return definition[key] converted to kind, or None if it is missing."""
+    value = definition.get(key)
+    if value is None:
+        return None
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} must be a number, got {value!r}") from None
+
+
+def compile_rules(
+    definitions: List[Dict[str, Any]], profile: ModelProfile
+) -> List[PictureRule]:
+    """Compile rule definitions in order, raising ValueError on the first bad one."""
+    rules = []
+    for index, definition in enumerate(definitions):
+        try:
+            rules.append(PictureRule(definition, profile))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Rule {index + 1}: {e}") from e
+    return rules
+
+
+class PictureRuleEngine:
+    """Apply the first matching picture rule after an input change."""
+
+    def __init__(
+        self, projector: SonyProjectorADCP, rules: Optional[List[PictureRule]] = None
+    ) -> None:
+        """Initialize the engine."""
+        self._projector = projector
+        self.rules: List[PictureRule] = rules or []
+        self.signal: Optional[SignalInfo] = None
+        self.applied: Optional[PictureRule] = None
+        self._task: Optional[asyncio.Task] = None
+
+        profile = projector.profile
+        self._queries: Dict[str, bytes] = {
+            parameter: profile.parameter(parameter).query
+            for parameter in ("power_status", "input", "signal", "hdr_format")
+            if profile.supports(parameter) and profile.parameter(parameter).readable
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if there are rules and the profile can read the signal."""
+        return bool(self.rules) and "signal" in self._queries
+
+    def trigger(self, on_applied: Optional[AppliedCallback] = None) -> None:
+        """Start the fast tier, replacing one that is already running."""
+        if not self.enabled:
+            return
+        self.cancel()
+        self._task = asyncio.get_running_loop().create_task(self._async_run(on_applied))
+
+    def cancel(self) -> None:
+        """Stop the fast tier if it is running."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def _async_read(self) -> Dict[str, Any]:
+        """Read power, input and signal in one batch."""
+        parameters = list(self._queries)
+        responses = await self._projector.send_encoded_batch(
+            [self._queries[parameter] for parameter in parameters]
+        )
+        profile = self._projector.profile
+        return {
+            parameter: profile.parameter(parameter).decode(response)
+            for parameter, response in zip(parameters, responses)
+            if response is not None and not is_error(response)
+        }
+
+    async def _async_run(self, on_applied: Optional[AppliedCallback]) -> None:
+        """Run the fast tier, logging any failure."""
+        try:
+            await self._async_apply(on_applied)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error applying picture rules")
+
+    async def _async_apply(self, on_applied: Optional[AppliedCallback]) -> None:
+        """Poll the signal until it is valid, then apply the matching rule."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SIGNAL_WINDOW
+        settled = loop.time() + SIGNAL_SETTLE
+        # Right after a switch the projector can still report the old
+        # source's signal. Only trust a signal once it differs from the last
+        # one seen, the signal was lost in between, or it held steady.
+        previous = self.signal
+        lost = False
+
+        while True:
+            values = await self._async_read()
+            power = values.get("power_status")
+            if power is not None and POWER_STATE_MAP.get(power) != "on":
+                _LOGGER.debug("Projector is off, not reading the signal")
+                return
+
+            signal = parse_signal(values.get("signal"), values.get("hdr_format"))
+            if signal is None:
+                lost = True
+            elif lost or signal != previous or loop.time() >= settled:
+                break
+            if loop.time() >= deadline:
+                _LOGGER.debug("No valid signal within %ss", SIGNAL_WINDOW)
+                return
+            await asyncio.sleep(SIGNAL_POLL_INTERVAL)
+
+        self.signal = signal
+        input_source = values.get("input")
+        rule = next((r for r in self.rules if r.matches(signal, input_source)), None)
+        if rule is None:
+            _LOGGER.debug("No picture rule matches %s on %s", signal, input_source)
+            return
+
+        # Shield the write so a new trigger never cuts the batch in half
+        responses = await asyncio.shield(
+            self._projector.send_encoded_batch(rule.commands)
+        )
+        applied = {
+            parameter: value
+            for (parameter, value), response in zip(rule.changes.items(), responses)
+            if response is not None and not is_error(response)
+        }
+        if len(applied) < len(rule.changes):
+            _LOGGER.warning(
+                "Picture rule %s only partly applied: %s", rule.name, responses
+            )
+        _LOGGER.debug("Applied picture rule %s for %s", rule.name, signal.raw)
+
+        self.applied = rule
+        if on_applied:
+            on_applied(rule, applied)
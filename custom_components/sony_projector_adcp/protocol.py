@@ -2,30 +2,230 @@
 import asyncio
 import hashlib
 import logging
-from typing import Optional
+import os
+import queue
+import struct
+import threading
+import time
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from .const import FALLBACK_PROFILE, MODEL_AUTO, RESPONSE_OK
+from .models import ModelProfile, find_profile, load_profile
+from .response import is_error, typed_decoder
 
 _LOGGER = logging.getLogger(__name__)
 
+_DECODE_INT = typed_decoder(int)
+
 NEWLINE = "\r\n"
 ENCODING = "ascii"
 TIMEOUT = 10
 
+QUERY_SUFFIX = " ?"
+_ENCODED_QUERY_SUFFIX = f"{QUERY_SUFFIX}{NEWLINE}".encode(ENCODING)
+
+# Traffic recording file format: a magic header followed by records of
+# timestamp (s), latency (us), flags, request length, response length,
+# request bytes and response bytes.
+RECORD_MAGIC = b"ADCPREC1"
+RECORD_HEADER = struct.Struct("<dIBHH")
+RECORD_FLAG_NO_RESPONSE = 0x01
+RECORD_MAX_BYTES = 1024 * 1024
+RECORD_BACKUP_COUNT = 3
+
+
+class TrafficRecord(NamedTuple):
+    """A single recorded request/response exchange."""
+
+    timestamp: float
+    latency: float
+    request: str
+    response: Optional[str]
+
+
+class TrafficRecorder:
+    """Append ADCP exchanges to a compact binary file with size-based rotation.
+
+    ``record`` only packs the exchange and queues it; a writer thread does
+    all file I/O, including rotation, so recording never blocks the event
+    loop. The writer flushes each time it catches up with the queue. The file is opened when the recorder is created and ``close``
+    waits for the writer, so call both from an executor when running
+    inside an event loop.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = RECORD_MAX_BYTES,
+        backup_count: int = RECORD_BACKUP_COUNT,
+    ) -> None:
+        """Initialize the recorder."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file: Optional[BinaryIO] = None
+        self._size = 0
+        self._open()
+
+        # None tells the writer thread to stop
+        self._queue: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="adcp_traffic_recorder", daemon=True
+        )
+        self._thread.start()
+
+    def _open(self) -> None:
+        """Open the recording file, writing the header if it is new."""
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+        if self._size == 0:
+            self._file.write(RECORD_MAGIC)
+            self._file.flush()
+            self._size = len(RECORD_MAGIC)
+
+    def _close_file(self) -> None:
+        """Flush and close the recording file."""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                _LOGGER.debug("Error closing traffic recording: %s", e)
+            finally:
+                self._file = None
+
+    def _rotate(self) -> None:
+        """Shift the backups and start a new recording file."""
+        self._close_file()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._open()
+
+    def record(
+        self,
+        timestamp: float,
+        latency: float,
+        request: bytes,
+        response: Optional[str],
+    ) -> None:
+        """Queue one exchange for the writer thread."""
+        if self._closed:
+            return
+
+        request = request.rstrip(b"\r\n")
+        flags = 0
+        if response is None:
+            flags |= RECORD_FLAG_NO_RESPONSE
+            encoded_response = b""
+        else:
+            encoded_response = response.encode(ENCODING, "replace")
+
+        record = (
+            RECORD_HEADER.pack(
+                timestamp,
+                min(int(latency * 1_000_000), 0xFFFFFFFF),
+                flags,
+                len(request),
+                len(encoded_response),
+            )
+            + request
+            + encoded_response
+        )
+
+        self._queue.put(record)
+
+    def _run(self) -> None:
+        """Write queued records until close is called."""
+        while (record := self._queue.get()) is not None:
+            try:
+                if self._size + len(record) > self.max_bytes:
+                    self._rotate()
+                if self._file is not None:
+                    self._file.write(record)
+                    self._size += len(record)
+                    # Flush whenever the queue drains so the file can be
+                    # read while recording and a crash loses little
+                    if self._queue.empty():
+                        self._file.flush()
+            except OSError as e:
+                _LOGGER.error("Error writing traffic recording: %s", e)
+                self._close_file()
+        self._close_file()
+
+    def close(self) -> None:
+        """Write the queued records and close the recording file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+
+def read_recording(path: str) -> Iterator[TrafficRecord]:
+    """Yield the exchanges stored in a recording file."""
+    with open(path, "rb") as recording:
+        if recording.read(len(RECORD_MAGIC)) != RECORD_MAGIC:
+            raise ValueError(f"{path} is not an ADCP traffic recording")
+
+        while True:
+            header = recording.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            timestamp, latency_us, flags, request_len, response_len = (
+                RECORD_HEADER.unpack(header)
+            )
+            request = recording.read(request_len).decode(ENCODING, "replace")
+            response = recording.read(response_len).decode(ENCODING, "replace")
+            yield TrafficRecord(
+                timestamp,
+                latency_us / 1_000_000,
+                request,
+                None if flags & RECORD_FLAG_NO_RESPONSE else response,
+            )
+
 
 class SonyProjectorADCP:
     """Handle ADCP protocol communication with Sony projector."""
 
-    def __init__(self, host: str, port: int, password: str = "", use_auth: bool = True):
-        """Initialize the ADCP connection."""
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        password: str = "",
+        use_auth: bool = True,
+        profile: Optional[ModelProfile] = None,
+        recorder: Optional[TrafficRecorder] = None,
+    ):
+        """Initialize the ADCP connection.
+
+        Without a profile the fallback profile is read from disk on first
+        use, so callers running in Home Assistant's event loop must load
+        one in the executor and pass it in.
+        """
         self.host = host
         self.port = port
         self.password = password
         self.use_auth = use_auth
+        self._profile = profile
+        self.recorder = recorder
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
         self._lock = asyncio.Lock()
+        # Bumped before every command that is not a query is sent, so
+        # response caches such as the proxy's can tell a value may have changed
+        self.write_generation = 0
 
     async def connect(self) -> bool:
         """Connect to the projector and authenticate if needed."""
+        if self._writer is not None:
+            # Replace a session the projector has closed
+            await self.disconnect()
         try:
             self._reader, self._writer = await asyncio.wait_for(
                 asyncio.open_connection(self.host, self.port),
@@ -73,6 +273,28 @@ class SonyProjectorADCP:
             _LOGGER.error("Error connecting to projector: %s", e)
             return False
 
+    @property
+    def connected(self) -> bool:
+        """Return True if the session is open and the projector has not closed it."""
+        return (
+            self._writer is not None
+            and self._reader is not None
+            and not self._writer.is_closing()
+            and not self._reader.at_eof()
+        )
+
+    @property
+    def profile(self) -> ModelProfile:
+        """Return the model profile, loading the default one if none was given."""
+        if self._profile is None:
+            self._profile = load_profile(FALLBACK_PROFILE)
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile: ModelProfile) -> None:
+        """Set the model profile."""
+        self._profile = profile
+
     async def disconnect(self):
         """Disconnect from the projector."""
         if self._writer:
@@ -85,19 +307,26 @@ class SonyProjectorADCP:
                 self._writer = None
                 self._reader = None
 
-    async def _read_line(self) -> str:
-        """Read a line from the projector."""
+    async def _read_line(
+        self, timeout: float = TIMEOUT, log_timeout: bool = True
+    ) -> str:
+        """Read a line from the projector.
+
+        Set log_timeout to False for reads bounded by a caller's deadline,
+        where running out of time is expected.
+        """
         if not self._reader:
             raise ConnectionError("Not connected")
         
         try:
             data = await asyncio.wait_for(
                 self._reader.readuntil(NEWLINE.encode(ENCODING)),
-                timeout=TIMEOUT
+                timeout=timeout
             )
             return data.decode(ENCODING).strip()
         except asyncio.TimeoutError:
-            _LOGGER.error("Timeout reading from projector")
+            if log_timeout:
+                _LOGGER.error("Timeout reading from projector")
             raise
         except Exception as e:
             _LOGGER.error("Error reading from projector: %s", e)
@@ -105,11 +334,15 @@ class SonyProjectorADCP:
 
     async def _write_line(self, data: str):
         """Write a line to the projector."""
+        await self._write(f"{data}{NEWLINE}".encode(ENCODING))
+
+    async def _write(self, payload: bytes):
+        """Write pre-encoded bytes to the projector."""
         if not self._writer:
             raise ConnectionError("Not connected")
         
         try:
-            self._writer.write(f"{data}{NEWLINE}".encode(ENCODING))
+            self._writer.write(payload)
             await self._writer.drain()
         except Exception as e:
             _LOGGER.error("Error writing to projector: %s", e)
@@ -117,116 +350,283 @@ class SonyProjectorADCP:
 
     async def send_command(self, command: str) -> Optional[str]:
         """Send a command and return the response."""
+        return await self.send_encoded(f"{command}{NEWLINE}".encode(ENCODING))
+
+    async def send_encoded(self, command: bytes) -> Optional[str]:
+        """Send a pre-encoded command line and return the response."""
         async with self._lock:
             # Ensure we're connected
-            if not self._writer or not self._reader:
+            if not self.connected:
                 if not await self.connect():
                     return None
             
+            started = time.monotonic()
+            response = None
+            # Log the command as readable text, not bytes
+            text = command.decode(ENCODING).strip()
             try:
                 # Send command
-                await self._write_line(command)
-                _LOGGER.debug("Sent command: %s", command)
+                if not command.endswith(_ENCODED_QUERY_SUFFIX):
+                    self.write_generation += 1
+                await self._write(command)
+                _LOGGER.debug("Sent command: %s", text)
                 
                 # Read response
                 response = await self._read_line()
                 _LOGGER.debug("Received response: %s", response)
                 
                 # Check for errors
-                if response.startswith("err_"):
-                    _LOGGER.error("Command error: %s for command: %s", response, command)
+                if is_error(response):
+                    _LOGGER.error("Command error: %s for command: %s", response, text)
                     return None
                 
                 return response
                 
             except Exception as e:
-                _LOGGER.error("Error sending command %s: %s", command, e)
+                _LOGGER.error("Error sending command %s: %s", text, e)
                 await self.disconnect()
                 return None
 
+            finally:
+                if self.recorder:
+                    self.recorder.record(
+                        time.time(), time.monotonic() - started, command, response
+                    )
+
+    async def send_batch(self, commands: List[str]) -> List[Optional[str]]:
+        """Send several commands as one pipelined batch and return the raw responses.
+
+        All commands are written at once under a single lock hold and the
+        responses are read back in order. Error codes such as ``err_cmd`` are
+        returned as-is. If the connection fails part way, the remaining
+        responses are None.
+        """
+        return await self.send_encoded_batch(
+            [f"{command}{NEWLINE}".encode(ENCODING) for command in commands]
+        )
+
+    async def send_encoded_batch(
+        self, commands: List[bytes], timeout: Optional[float] = None
+    ) -> List[Optional[str]]:
+        """Send pre-encoded command lines as one pipelined batch.
+
+        With a timeout, the batch (including connecting) must finish within
+        that many seconds. Responses that have not arrived by then are None
+        and the connection is dropped so no late reply is read as the answer
+        to a later command.
+        """
+        responses: List[Optional[str]] = []
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        if deadline is None:
+            await self._lock.acquire()
+        else:
+            # Waiting for another exchange counts against the budget
+            try:
+                if timeout <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(self._lock.acquire(), timeout)
+            except asyncio.TimeoutError:
+                _LOGGER.debug("Projector busy, skipping batch of %d", len(commands))
+                return [None] * len(commands)
+
+        try:
+            if not self.connected:
+                try:
+                    connected = await asyncio.wait_for(
+                        self.connect(),
+                        None if deadline is None else max(deadline - loop.time(), 0),
+                    )
+                except asyncio.TimeoutError:
+                    _LOGGER.debug("Connecting took longer than the batch timeout")
+                    await self.disconnect()
+                    connected = False
+                if not connected:
+                    return [None] * len(commands)
+
+            if deadline is not None and loop.time() >= deadline:
+                _LOGGER.debug("Batch budget spent before sending")
+                return [None] * len(commands)
+
+            started = time.monotonic()
+            try:
+                if not all(c.endswith(_ENCODED_QUERY_SUFFIX) for c in commands):
+                    self.write_generation += 1
+                await self._write(b"".join(commands))
+                _LOGGER.debug("Sent batch of %d commands", len(commands))
+
+                for command in commands:
+                    if deadline is None:
+                        responses.append(await self._read_line())
+                    else:
+                        read_timeout = min(deadline - loop.time(), TIMEOUT)
+                        if read_timeout <= 0:
+                            raise asyncio.TimeoutError
+                        responses.append(
+                            await self._read_line(read_timeout, log_timeout=False)
+                        )
+                    if self.recorder:
+                        # Record the time this response took after the previous one
+                        now = time.monotonic()
+                        self.recorder.record(
+                            time.time(), now - started, command, responses[-1]
+                        )
+                        started = now
+                _LOGGER.debug("Received batch responses: %s", responses)
+
+            except asyncio.TimeoutError:
+                _LOGGER.debug(
+                    "Batch timed out after %d of %d responses",
+                    len(responses),
+                    len(commands),
+                )
+                await self.disconnect()
+                if self.recorder:
+                    for command in commands[len(responses):]:
+                        self.recorder.record(time.time(), 0.0, command, None)
+
+            except Exception as e:
+                _LOGGER.error("Error sending command batch: %s", e)
+                await self.disconnect()
+                if self.recorder:
+                    for command in commands[len(responses):]:
+                        self.recorder.record(time.time(), 0.0, command, None)
+        finally:
+            self._lock.release()
+
+        responses.extend([None] * (len(commands) - len(responses)))
+        return responses
+
+    async def query(self, parameter: str) -> Any:
+        """Query a profile parameter and return its decoded value."""
+        spec = self.profile.parameter(parameter)
+        if spec.query is None:
+            raise ValueError(f"Parameter {parameter} cannot be queried")
+        return spec.decode(await self.send_encoded(spec.query))
+
+    async def query_many(
+        self, parameters: Iterable[str], timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Query several profile parameters in one pipelined batch.
+
+        Parameters the profile cannot query are skipped, and so are parameters
+        that got no response (connection failure or timeout). Parameters that
+        returned an error code or an unexpected value map to None.
+        """
+        specs = [
+            spec
+            for spec in (self.profile.parameters.get(name) for name in parameters)
+            if spec is not None and spec.query is not None
+        ]
+        responses = await self.send_encoded_batch(
+            [spec.query for spec in specs], timeout
+        )
+        return {
+            spec.name: spec.decode(response)
+            for spec, response in zip(specs, responses)
+            if response is not None
+        }
+
+    async def set_value(self, parameter: str, value: Any) -> bool:
+        """Set a profile parameter to value."""
+        command = self.profile.parameter(parameter).encode_set(value)
+        response = await self.send_encoded(command)
+        return response == RESPONSE_OK
+
     async def get_power_status(self) -> Optional[str]:
         """Get the current power status."""
-        response = await self.send_command("power_status ?")
-        if response and response.startswith('"') and response.endswith('"'):
-            return response.strip('"')
-        return None
+        return await self.query("power_status")
 
     async def set_power(self, state: bool) -> bool:
         """Set power on or off."""
-        command = 'power "on"' if state else 'power "off"'
-        response = await self.send_command(command)
-        return response == "ok"
+        return await self.set_value("power", "on" if state else "off")
 
     async def get_input(self) -> Optional[str]:
         """Get current input source."""
-        response = await self.send_command("input ?")
-        if response and response.startswith('"') and response.endswith('"'):
-            return response.strip('"')
-        return None
+        return await self.query("input")
 
     async def set_input(self, source: str) -> bool:
         """Set input source."""
-        command = f'input "{source}"'
-        response = await self.send_command(command)
-        return response == "ok"
+        return await self.set_value("input", source)
 
     async def get_blank_status(self) -> Optional[bool]:
         """Get video muting status."""
-        response = await self.send_command("blank ?")
-        if response and response.startswith('"') and response.endswith('"'):
-            return response.strip('"') == "on"
+        blank = await self.query("blank")
+        if blank is not None:
+            return blank == "on"
         return None
 
     async def set_blank(self, state: bool) -> bool:
         """Set video muting."""
-        command = 'blank "on"' if state else 'blank "off"'
-        response = await self.send_command(command)
-        return response == "ok"
+        return await self.set_value("blank", "on" if state else "off")
 
     async def get_picture_mode(self) -> Optional[str]:
         """Get current picture mode."""
-        response = await self.send_command("picture_mode ?")
-        if response and response.startswith('"') and response.endswith('"'):
-            return response.strip('"')
-        return None
+        return await self.query("picture_mode")
 
     async def set_picture_mode(self, mode: str) -> bool:
         """Set picture mode."""
-        command = f'picture_mode "{mode}"'
-        response = await self.send_command(command)
-        return response == "ok"
+        return await self.set_value("picture_mode", mode)
 
     async def get_numeric_value(self, parameter: str) -> Optional[int]:
-        """Get a numeric parameter value."""
-        response = await self.send_command(f"{parameter} ?")
-        if response and response.isdigit():
-            return int(response)
-        # Handle negative numbers
-        if response and response.lstrip('-').isdigit():
-            return int(response)
-        return None
+        """Get a numeric parameter value.
+
+        Parameters the profile does not declare are queried as raw ADCP
+        parameters.
+        """
+        if self.profile.supports(parameter):
+            return await self.query(parameter)
+        return _DECODE_INT(await self.send_command(f"{parameter} ?"))
 
     async def set_numeric_value(self, parameter: str, value: int) -> bool:
-        """Set a numeric parameter value."""
-        command = f"{parameter} {value}"
-        response = await self.send_command(command)
-        return response == "ok"
+        """Set a numeric parameter value.
+
+        Parameters the profile does not declare are set as raw ADCP
+        parameters without range validation.
+        """
+        if self.profile.supports(parameter):
+            return await self.set_value(parameter, value)
+        response = await self.send_command(f"{parameter} {int(value)}")
+        return response == RESPONSE_OK
 
     async def send_key(self, key: str) -> bool:
         """Send a remote control key command."""
-        command = f'key "{key}"'
-        response = await self.send_command(command)
-        return response == "ok"
+        return await self.set_value("key", key)
 
     async def get_reality_creation(self) -> Optional[str]:
         """Get Reality Creation status."""
-        response = await self.send_command("real_cre ?")
-        if response and response.startswith('"') and response.endswith('"'):
-            return response.strip('"')
-        return None
+        return await self.query("real_cre")
 
     async def set_reality_creation(self, state: str) -> bool:
         """Set Reality Creation on/off."""
-        command = f'real_cre "{state}"'
-        response = await self.send_command(command)
-        return response == "ok"
\ No newline at end of file
+        return await self.set_value("real_cre", state)
+
+    async def get_model_name(self) -> Optional[str]:
+        """Get the model name reported by the projector."""
+        return await self.query("modelname")
+
+
+async def async_open_projector(
+    host: str,
+    port: int,
+    password: str = "",
+    use_auth: bool = True,
+    model: str = MODEL_AUTO,
+) -> SonyProjectorADCP:
+    """Connect to a projector and pick its profile, detecting it for MODEL_AUTO.
+
+    Profiles are read from disk, so this must not run in Home Assistant's
+    event loop. Raises ConnectionError if the projector cannot be reached.
+    """
+    profile = load_profile(FALLBACK_PROFILE if model == MODEL_AUTO else model)
+    projector = SonyProjectorADCP(host, port, password, use_auth, profile)
+
+    if not await projector.connect():
+        raise ConnectionError(f"cannot connect to {host}:{port}")
+
+    if model == MODEL_AUTO:
+        model_name = await projector.get_model_name()
+        projector.profile = (model_name and find_profile(model_name)) or profile
+
+    return projector
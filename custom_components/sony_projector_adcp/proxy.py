@@ -0,0 +1,212 @@
+"""ADCP multiplexing proxy.
+
+Sony projectors accept only a few ADCP sessions at a time. The proxy
+listens for any number of downstream ADCP clients, authenticates each of
+them with the usual NOKEY or SHA256 challenge, and forwards their commands
+over the single upstream session of a ``SonyProjectorADCP``.
+
+Commands that arrive while an upstream batch is in flight are queued and
+sent together as the next pipelined batch. Identical concurrent queries
+share one upstream request, and query responses are cached for a short
+TTL. Any other command (a set, a key press) sent on the upstream client
+invalidates the cache, whether it came through the proxy or from Home
+Assistant.
+"""
+import asyncio
+import hashlib
+import hmac
+import logging
+import secrets
+from typing import Dict, List, Optional, Tuple
+
+from .const import PROXY_CACHE_TTL
+from .protocol import ENCODING, NEWLINE, QUERY_SUFFIX, SonyProjectorADCP
+
+_LOGGER = logging.getLogger(__name__)
+
+AUTH_NOKEY = "NOKEY"
+AUTH_OK = "OK"
+ERROR_AUTH = "err_auth"
+# Returned to a client when the projector did not answer
+ERROR_UPSTREAM = "err_internal"
+
+
+def is_query(command: str) -> bool:
+    """Return True if command only reads a value."""
+    return command.endswith(QUERY_SUFFIX)
+
+
+class ADCPProxy:
+    """Serve many ADCP clients over one projector session."""
+
+    def __init__(
+        self,
+        projector: SonyProjectorADCP,
+        password: str = "",
+        use_auth: bool = True,
+        cache_ttl: float = PROXY_CACHE_TTL,
+    ) -> None:
+        """Initialize the proxy.
+
+        Downstream clients authenticate with password when use_auth is set.
+        """
+        self._projector = projector
+        self._password = password
+        self._use_auth = use_auth
+        self._cache_ttl = cache_ttl
+        self._server: Optional[asyncio.AbstractServer] = None
+        # Handler task and writer of every connected client
+        self._clients: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flusher: Optional[asyncio.Task] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Expiry time, upstream write generation and response of each query
+        self._cache: Dict[str, Tuple[float, int, str]] = {}
+
+    @property
+    def clients(self) -> int:
+        """Return the number of connected clients."""
+        return len(self._clients)
+
+    @property
+    def port(self) -> Optional[int]:
+        """Return the port the proxy listens on."""
+        if self._server is None or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: Optional[str], port: int) -> None:
+        """Start listening for clients."""
+        self._server = await asyncio.start_server(self._async_handle_client, host, port)
+        _LOGGER.info(
+            "ADCP proxy for %s listening on port %s", self._projector.host, self.port
+        )
+
+    async def stop(self) -> None:
+        """Stop listening and disconnect every client."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+        # Closing a client's connection ends its handler at the next read
+        for writer in self._clients.values():
+            writer.close()
+        if self._clients:
+            await asyncio.wait(list(self._clients))
+        if server is not None:
+            await server.wait_closed()
+        if self._flusher is not None:
+            self._flusher.cancel()
+
+    async def serve_forever(self) -> None:
+        """Serve clients until cancelled."""
+        if self._server is None:
+            raise RuntimeError("Proxy is not started")
+        await self._server.serve_forever()
+
+    async def _async_handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Authenticate one client and answer its commands in order."""
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        peer = writer.get_extra_info("peername")
+        _LOGGER.debug("ADCP client %s connected", peer)
+
+        async def _write_line(line: str) -> None:
+            writer.write(f"{line}{NEWLINE}".encode(ENCODING))
+            await writer.drain()
+
+        async def _read_line() -> str:
+            data = await reader.readuntil(NEWLINE.encode(ENCODING))
+            return data.decode(ENCODING, "replace").strip()
+
+        try:
+            if self._use_auth:
+                nonce = secrets.token_hex(4)
+                await _write_line(nonce)
+                expected = hashlib.sha256(
+                    f"{nonce}{self._password}".encode()
+                ).hexdigest()
+                if not hmac.compare_digest(await _read_line(), expected):
+                    _LOGGER.warning("ADCP client %s failed to authenticate", peer)
+                    await _write_line(ERROR_AUTH)
+                    return
+                await _write_line(AUTH_OK)
+            else:
+                await _write_line(AUTH_NOKEY)
+
+            while True:
+                command = await _read_line()
+                if not command:
+                    continue
+                response = await self.async_execute(command)
+                await _write_line(ERROR_UPSTREAM if response is None else response)
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.debug("Error serving ADCP client %s: %s", peer, e)
+        finally:
+            self._clients.pop(task, None)
+            writer.close()
+            _LOGGER.debug("ADCP client %s disconnected", peer)
+
+    async def async_execute(self, command: str) -> Optional[str]:
+        """Run one command for a client and return the raw response."""
+        if not is_query(command):
+            self._cache.clear()
+            return await self._async_forward(command)
+
+        loop = asyncio.get_running_loop()
+        cached = self._cache.get(command)
+        if (
+            cached is not None
+            and cached[0] > loop.time()
+            and cached[1] == self._projector.write_generation
+        ):
+            return cached[2]
+
+        task = self._inflight.get(command)
+        if task is None:
+            task = loop.create_task(self._async_query(command))
+            self._inflight[command] = task
+        # Shield the shared request from clients that disconnect while waiting
+        return await asyncio.shield(task)
+
+    async def _async_query(self, command: str) -> Optional[str]:
+        """Forward a query and cache its response."""
+        # A write sent after this point may have changed the answer
+        generation = self._projector.write_generation
+        try:
+            response = await self._async_forward(command)
+        finally:
+            self._inflight.pop(command, None)
+        if response is not None and generation == self._projector.write_generation:
+            expires = asyncio.get_running_loop().time() + self._cache_ttl
+            self._cache[command] = (expires, generation, response)
+        return response
+
+    async def _async_forward(self, command: str) -> Optional[str]:
+        """Queue a command for the next upstream batch and wait for its response."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((command, future))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._async_flush())
+        return await future
+
+    async def _async_flush(self) -> None:
+        """Send queued commands upstream, one pipelined batch at a time."""
+        while self._pending:
+            batch, self._pending = self._pending, []
+            try:
+                responses = await self._projector.send_batch(
+                    [command for command, _ in batch]
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                _LOGGER.debug("Error forwarding ADCP batch: %s", e)
+                responses = [None] * len(batch)
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
@@ -0,0 +1,138 @@
+"""Replay recorded ADCP traffic over a local socket.
+
+Serves a recording made by ``TrafficRecorder`` as if it were the projector:
+each request is answered with the recorded response after the recorded
+latency. Point the integration (or any ADCP client) at the replay address
+to reproduce a field installation offline.
+
+Usage::
+
+    python -m custom_components.sony_projector_adcp.replay 192.168.1.100_53595.adcp [more.adcp ...]
+"""
+import argparse
+import asyncio
+import logging
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Optional, Sequence
+
+from .protocol import ENCODING, NEWLINE, TrafficRecord, read_recording
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 53595
+UNKNOWN_RESPONSE = "err_cmd"
+
+
+class ReplayServer:
+    """Answer ADCP requests from a recording with the original timings."""
+
+    def __init__(self, records: Sequence[TrafficRecord], speed: float = 1.0) -> None:
+        """Initialize the replay server."""
+        self.records = list(records)
+        self.speed = speed
+        self._queues: Dict[str, Deque[TrafficRecord]] = {}
+        self._last: Dict[str, TrafficRecord] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Rewind the recording to the beginning."""
+        queues: Dict[str, Deque[TrafficRecord]] = defaultdict(deque)
+        for record in self.records:
+            queues[record.request].append(record)
+        self._queues = dict(queues)
+        self._last = {}
+
+    def next_record(self, request: str) -> Optional[TrafficRecord]:
+        """Return the next recorded exchange for request.
+
+        Each request replays its recorded responses in order. Once they are
+        used up, the last one is repeated.
+        """
+        queue = self._queues.get(request)
+        if queue:
+            self._last[request] = queue.popleft()
+        return self._last.get(request)
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one ADCP client connection."""
+        peer = writer.get_extra_info("peername")
+        _LOGGER.info("Replay client connected: %s", peer)
+        writer.write(f"NOKEY{NEWLINE}".encode(ENCODING))
+
+        try:
+            while line := await reader.readline():
+                request = line.decode(ENCODING, "replace").strip()
+                if not request:
+                    continue
+
+                record = self.next_record(request)
+                if record is None:
+                    _LOGGER.warning("No recorded response for %s", request)
+                    response: Optional[str] = UNKNOWN_RESPONSE
+                else:
+                    await asyncio.sleep(record.latency / self.speed)
+                    response = record.response
+
+                if response is None:
+                    # The projector never answered this request
+                    _LOGGER.info("Recorded connection drop on %s", request)
+                    break
+
+                writer.write(f"{response}{NEWLINE}".encode(ENCODING))
+                await writer.drain()
+        except ConnectionError as e:
+            _LOGGER.debug("Replay client %s disconnected: %s", peer, e)
+        finally:
+            writer.close()
+            _LOGGER.info("Replay client disconnected: %s", peer)
+
+
+def load_records(paths: Sequence[str]) -> List[TrafficRecord]:
+    """Load and merge recordings in timestamp order."""
+    records: List[TrafficRecord] = []
+    for path in paths:
+        records.extend(read_recording(path))
+    records.sort(key=lambda record: record.timestamp)
+    return records
+
+
+async def serve(
+    records: Sequence[TrafficRecord],
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    speed: float = 1.0,
+) -> None:
+    """Serve a recording until cancelled."""
+    replay = ReplayServer(records, speed)
+    server = await asyncio.start_server(replay.handle_client, host, port)
+    _LOGGER.info("Replaying %d exchanges on %s:%s", len(records), host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the replay tool."""
+    parser = argparse.ArgumentParser(description="Replay recorded ADCP traffic")
+    parser.add_argument("recordings", nargs="+", help="recording files to replay")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="latency divisor (2 = twice as fast)"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    records = load_records(args.recordings)
+
+    try:
+        asyncio.run(serve(records, args.host, args.port, args.speed))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
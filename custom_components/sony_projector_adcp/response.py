@@ -0,0 +1,96 @@
+"""Table-driven decoding of ADCP response lines.
+
+The first character of a response decides its shape, so a single table
+lookup picks the decoder: quoted strings, signed integers, JSON lists and
+objects, ``ok`` and ``err_*`` codes.
+"""
+import json
+import re
+from typing import Any, Callable, Dict, Optional
+
+from .const import ERROR_PREFIX, RESPONSE_OK
+
+
+class ResponseError(str):
+    """An ``err_*`` code returned by the projector."""
+
+    __slots__ = ()
+
+
+class ResponseOk(str):
+    """The ``ok`` acknowledgement, kept apart from quoted string values."""
+
+    __slots__ = ()
+
+
+_INT_PATTERN = re.compile(r"-?\d+")
+
+
+def _decode_quoted(line: str) -> Optional[str]:
+    """Decode a quoted string such as ``"hdmi1"``."""
+    if len(line) >= 2 and line[-1] == '"':
+        return line[1:-1]
+    return None
+
+
+def _decode_int(line: str) -> Optional[int]:
+    """Decode a signed integer such as ``-3``."""
+    if _INT_PATTERN.fullmatch(line):
+        return int(line)
+    return None
+
+
+def _decode_json(line: str) -> Any:
+    """Decode a JSON list or object."""
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def _decode_word(line: str) -> Any:
+    """Decode ``ok`` or an ``err_*`` code."""
+    if line == RESPONSE_OK:
+        return ResponseOk(line)
+    if line.startswith(ERROR_PREFIX):
+        return ResponseError(line)
+    return None
+
+
+_DECODERS: Dict[str, Callable[[str], Any]] = {
+    '"': _decode_quoted,
+    "[": _decode_json,
+    "{": _decode_json,
+    "-": _decode_int,
+    "o": _decode_word,
+    "e": _decode_word,
+}
+_DECODERS.update(dict.fromkeys("0123456789", _decode_int))
+
+
+def decode_response(line: Optional[str]) -> Any:
+    """Decode a response line.
+
+    Returns a str for quoted values, an int for numbers, a list or dict for
+    JSON, a ``ResponseOk`` (equal to ``RESPONSE_OK``) for ``ok``, a
+    ``ResponseError`` for error codes and None for anything else.
+    """
+    if not line:
+        return None
+    decoder = _DECODERS.get(line[0])
+    return decoder(line) if decoder else None
+
+
+def is_error(line: Optional[str]) -> bool:
+    """Return True if line is an ``err_*`` code."""
+    return line is not None and line.startswith(ERROR_PREFIX)
+
+
+def typed_decoder(*types: type) -> Callable[[Optional[str]], Any]:
+    """Return a decoder that only accepts values of exactly the given types."""
+
+    def _decode(line: Optional[str]) -> Any:
+        value = decode_response(line)
+        return value if type(value) in types else None
+
+    return _decode
@@ -0,0 +1,77 @@
+"""Runtime data for a set-up Sony Projector ADCP config entry.
+
+Only imported when an entry is set up, so importing the ADCP client from
+this package does not load the Home Assistant side of the integration.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .picture_rules import PictureRuleEngine, compile_rules
+from .protocol import SonyProjectorADCP
+from .proxy import ADCPProxy
+from .state import EMPTY_STATE, ProjectorState
+from .telemetry import TelemetrySampler
+from .transition import TransitionScheduler
+
+if TYPE_CHECKING:
+    from .media_player import SonyProjectorMediaPlayer
+
+_LOGGER = logging.getLogger(__name__)
+
+# Proxy listen addresses that only accept clients on this host
+LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+
+@dataclass
+class SonyProjectorData:
+    """Runtime data shared by the platforms of one projector."""
+
+    projector: SonyProjectorADCP
+    telemetry: TelemetrySampler
+    transitions: TransitionScheduler
+    picture_rules: PictureRuleEngine
+    # Options that need a reload when they change
+    options: Dict[str, Any]
+    proxy: Optional[ADCPProxy] = None
+    # Snapshot polled by the media player and shared by the setting entities
+    state: ProjectorState = EMPTY_STATE
+    media_player: Optional[SonyProjectorMediaPlayer] = None
+
+
+def create_data(
+    projector: SonyProjectorADCP,
+    rule_definitions: List[Dict[str, Any]],
+    options: Dict[str, Any],
+) -> SonyProjectorData:
+    """Create the runtime data, ignoring picture rules that do not compile."""
+    try:
+        rules = compile_rules(rule_definitions, projector.profile)
+    except ValueError as e:
+        _LOGGER.error("Ignoring invalid picture rules: %s", e)
+        rules = []
+
+    return SonyProjectorData(
+        projector,
+        TelemetrySampler(projector),
+        TransitionScheduler(projector),
+        PictureRuleEngine(projector, rules),
+        options,
+    )
+
+
+async def async_start_proxy(
+    data: SonyProjectorData, host: str, port: int, password: str, use_auth: bool
+) -> None:
+    """Share the entry's session with other ADCP clients through a proxy."""
+    if not use_auth and host not in LOOPBACK_HOSTS:
+        _LOGGER.warning("ADCP proxy on %s accepts clients without authentication", host)
+    proxy = ADCPProxy(data.projector, password, use_auth)
+    try:
+        await proxy.start(host, port)
+    except OSError as e:
+        _LOGGER.error("Cannot start ADCP proxy on port %s: %s", port, e)
+        return
+    data.proxy = proxy
@@ -0,0 +1,83 @@
+"""Select entities for Sony Projector ADCP picture mode and input."""
+import logging
+from typing import Optional
+
+from homeassistant.components.select import SelectEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .entity import SonyProjectorSettingEntity
+from .runtime import SonyProjectorData
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Sony Projector select entities."""
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    profile = data.projector.profile
+    entry_id = config_entry.entry_id
+
+    entities: list[SelectEntity] = []
+    if profile.picture_modes:
+        entities.append(SonyProjectorPictureModeSelect(data, entry_id))
+    if profile.inputs:
+        entities.append(SonyProjectorInputSelect(data, entry_id))
+    async_add_entities(entities)
+
+
+class SonyProjectorPictureModeSelect(SonyProjectorSettingEntity, SelectEntity):
+    """The picture mode."""
+
+    _attr_icon = "mdi:palette"
+
+    def __init__(self, data: SonyProjectorData, entry_id: str) -> None:
+        """Initialize the select."""
+        super().__init__(data, entry_id, "picture_mode", "Picture mode")
+        self._modes = data.projector.profile.picture_modes
+        self._attr_options = list(self._modes.values())
+
+    @property
+    def current_option(self) -> Optional[str]:
+        """Return the current picture mode."""
+        mode = self._snapshot.picture_mode
+        return self._modes.get(mode, mode) if mode else None
+
+    async def async_select_option(self, option: str) -> None:
+        """Set the picture mode."""
+        for mode, label in self._modes.items():
+            if label == option:
+                await self._async_command("async_set_picture_mode_service", mode)
+                return
+        raise HomeAssistantError(f"Unsupported picture mode: {option}")
+
+
+class SonyProjectorInputSelect(SonyProjectorSettingEntity, SelectEntity):
+    """The input source."""
+
+    _attr_icon = "mdi:video-input-hdmi"
+
+    def __init__(self, data: SonyProjectorData, entry_id: str) -> None:
+        """Initialize the select."""
+        super().__init__(data, entry_id, "input", "Input")
+        self._inputs = data.projector.profile.inputs
+        self._attr_options = list(self._inputs.values())
+
+    @property
+    def current_option(self) -> Optional[str]:
+        """Return the current input source."""
+        source = self._snapshot.input
+        return self._inputs.get(source) if source else None
+
+    async def async_select_option(self, option: str) -> None:
+        """Select the input source."""
+        if option not in self._attr_options:
+            raise HomeAssistantError(f"Unsupported input: {option}")
+        await self._async_command("async_select_source", option)
@@ -0,0 +1,127 @@
+"""Diagnostic telemetry sensors for Sony Projector ADCP."""
+from datetime import datetime, timezone
+import logging
+from typing import Any, Optional
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, SIGNAL_TELEMETRY_UPDATED
+from .telemetry import (
+    KIND_CODES,
+    KIND_HOURS,
+    KIND_TEMPERATURE,
+    TelemetryChannel,
+    TelemetrySampler,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_CODES = "codes"
+ATTR_TREND = "trend_per_hour"
+ATTR_LONG_TERM_TREND = "long_term_trend_per_hour"
+ATTR_SAMPLED_AT = "sampled_at"
+
+NO_CODES = "none"
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Sony Projector telemetry sensors."""
+    telemetry = hass.data[DOMAIN][config_entry.entry_id].telemetry
+
+    async_add_entities(
+        SonyProjectorTelemetrySensor(telemetry, channel, config_entry.entry_id)
+        for channel in telemetry.channels.values()
+    )
+
+
+class SonyProjectorTelemetrySensor(SensorEntity):
+    """A diagnostic sensor backed by the telemetry sampler."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self, telemetry: TelemetrySampler, channel: TelemetryChannel, entry_id: str
+    ) -> None:
+        """Initialize the sensor."""
+        self._telemetry = telemetry
+        self._channel = channel
+        self._entry_id = entry_id
+        self._attr_unique_id = f"{entry_id}_{channel.key}"
+        self._attr_name = channel.key.replace("_", " ").capitalize()
+        self._attr_device_info = {"identifiers": {(DOMAIN, entry_id)}}
+
+        if channel.kind == KIND_HOURS:
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.HOURS
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        elif channel.kind == KIND_TEMPERATURE:
+            self._attr_device_class = SensorDeviceClass.TEMPERATURE
+            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+        elif channel.kind == KIND_CODES:
+            self._attr_icon = "mdi:alert-circle-outline"
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to telemetry updates."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_TELEMETRY_UPDATED.format(self._entry_id),
+                self._async_telemetry_updated,
+            )
+        )
+
+    @callback
+    def _async_telemetry_updated(self) -> None:
+        """Write the new sample to the state machine."""
+        self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return True once the channel has been sampled."""
+        return self._channel.key in self._telemetry.latest
+
+    @property
+    def native_value(self) -> Any:
+        """Return the latest sampled value."""
+        value = self._telemetry.latest.get(self._channel.key)
+        if self._channel.kind == KIND_CODES and value is not None:
+            return ", ".join(value) if value else NO_CODES
+        return value
+
+    @property
+    def extra_state_attributes(self) -> Optional[dict[str, Any]]:
+        """Return the trend and sample time."""
+        attrs: dict[str, Any] = {}
+
+        if self._channel.kind == KIND_CODES:
+            attrs[ATTR_CODES] = list(self._telemetry.latest.get(self._channel.key, ()))
+        else:
+            trend = self._telemetry.trend(self._channel.key)
+            if trend is not None:
+                attrs[ATTR_TREND] = round(trend, 3)
+            long_term_trend = self._telemetry.long_term_trend(self._channel.key)
+            if long_term_trend is not None:
+                attrs[ATTR_LONG_TERM_TREND] = round(long_term_trend, 3)
+
+        if self._telemetry.updated is not None:
+            attrs[ATTR_SAMPLED_AT] = datetime.fromtimestamp(
+                self._telemetry.updated, timezone.utc
+            ).isoformat()
+
+        return attrs
@@ -0,0 +1,110 @@
+"""Immutable snapshot of a projector's polled state."""
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .const import POWER_STATE_MAP
+
+# Snapshot field for each polled ADCP parameter, most important first
+PARAMETER_FIELDS: Dict[str, str] = {
+    "power_status": "power",
+    "input": "input",
+    "picture_mode": "picture_mode",
+    "blank": "blank",
+    "light_output_val": "light_output",
+    "brightness": "brightness",
+    "contrast": "contrast",
+    "sharpness": "sharpness",
+    "real_cre": "reality_creation",
+}
+
+FIELD_PARAMETERS: Dict[str, str] = {
+    field: parameter for parameter, field in PARAMETER_FIELDS.items()
+}
+
+# Fields that only make sense while the projector is on
+POWERED_FIELDS: Tuple[str, ...] = tuple(
+    field for field in PARAMETER_FIELDS.values() if field != "power"
+)
+
+
+class ProjectorState:
+    """An immutable, comparable snapshot of the projector state.
+
+    Fields are None until they have been read. Use ``replace`` to derive a
+    new snapshot; unchanged updates return the same object, so consumers can
+    compare snapshots by identity before comparing them by value.
+    """
+
+    __slots__ = (
+        "power",
+        "input",
+        "blank",
+        "picture_mode",
+        "brightness",
+        "contrast",
+        "sharpness",
+        "light_output",
+        "reality_creation",
+    )
+
+    power: Optional[str]
+    input: Optional[str]
+    blank: Optional[str]
+    picture_mode: Optional[str]
+    brightness: Optional[int]
+    contrast: Optional[int]
+    sharpness: Optional[int]
+    light_output: Optional[int]
+    reality_creation: Optional[str]
+
+    def __init__(self, **fields: Any) -> None:
+        """Initialize the snapshot."""
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"Unknown state fields: {', '.join(fields)}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject mutation."""
+        raise AttributeError("ProjectorState is immutable, use replace()")
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over (field, value) pairs."""
+        for name in self.__slots__:
+            yield name, getattr(self, name)
+
+    def _values(self) -> Tuple[Any, ...]:
+        """Return the field values as a tuple."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare snapshots field by field."""
+        if not isinstance(other, ProjectorState):
+            return NotImplemented
+        return self is other or self._values() == other._values()
+
+    def __hash__(self) -> int:
+        """Hash the field values."""
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        fields = ", ".join(f"{name}={value!r}" for name, value in self if value is not None)
+        return f"ProjectorState({fields})"
+
+    def replace(self, **changes: Any) -> "ProjectorState":
+        """Return a snapshot with changes applied, or self if nothing changed."""
+        if all(getattr(self, name) == value for name, value in changes.items()):
+            return self
+        return ProjectorState(**{**dict(self), **changes})
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the fields that have a value."""
+        return {name: value for name, value in self if value is not None}
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the projector is powered on."""
+        return POWER_STATE_MAP.get(self.power) == "on"
+
+
+EMPTY_STATE = ProjectorState()
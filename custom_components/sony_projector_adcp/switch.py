@@ -0,0 +1,80 @@
+"""Switch entities for Sony Projector ADCP blank and Reality Creation."""
+import logging
+from typing import Any, Optional
+
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .entity import SonyProjectorSettingEntity
+from .runtime import SonyProjectorData
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Sony Projector switches."""
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    profile = data.projector.profile
+    entry_id = config_entry.entry_id
+
+    entities: list[SwitchEntity] = []
+    if profile.supports("blank"):
+        entities.append(SonyProjectorBlankSwitch(data, entry_id))
+    if profile.supports("real_cre"):
+        entities.append(SonyProjectorRealityCreationSwitch(data, entry_id))
+    async_add_entities(entities)
+
+
+class SonyProjectorBlankSwitch(SonyProjectorSettingEntity, SwitchEntity):
+    """Picture blanking (video mute)."""
+
+    _attr_icon = "mdi:projector-screen-off-outline"
+
+    def __init__(self, data: SonyProjectorData, entry_id: str) -> None:
+        """Initialize the switch."""
+        super().__init__(data, entry_id, "blank", "Blank")
+
+    @property
+    def is_on(self) -> Optional[bool]:
+        """Return True if the picture is blanked."""
+        blank = self._snapshot.blank
+        return None if blank is None else blank == "on"
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Blank the picture."""
+        await self._async_command("async_set_blank", True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Show the picture."""
+        await self._async_command("async_set_blank", False)
+
+
+class SonyProjectorRealityCreationSwitch(SonyProjectorSettingEntity, SwitchEntity):
+    """Reality Creation."""
+
+    _attr_icon = "mdi:auto-fix"
+
+    def __init__(self, data: SonyProjectorData, entry_id: str) -> None:
+        """Initialize the switch."""
+        super().__init__(data, entry_id, "reality_creation", "Reality Creation")
+
+    @property
+    def is_on(self) -> Optional[bool]:
+        """Return True if Reality Creation is on."""
+        state = self._snapshot.reality_creation
+        return None if state is None else state == "on"
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn Reality Creation on."""
+        await self._async_command("async_set_reality_creation", "on")
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn Reality Creation off."""
+        await self._async_command("async_set_reality_creation", "off")
@@ -0,0 +1,197 @@
+"""Synchronous, thread-safe facade over the asyncio ADCP client.
+
+For synchronous tools such as web dashboards and cron jobs. A
+``SyncClient`` runs one event loop in a background thread and keeps one
+authenticated ``SonyProjectorADCP`` per projector in that loop, so repeated
+calls reuse warm sessions instead of connecting and authenticating every
+time. A session the projector closed while idle is reopened on the next
+call. Any thread may call into it.
+
+Usage::
+
+    with SyncClient(password="Projector") as client:
+        projector = client.projector("192.168.1.100")
+        projector.set_value("brightness", 60)
+        futures = [client.projector(host).submit("query", "input") for host in hosts]
+"""
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .const import DEFAULT_PASSWORD, DEFAULT_PORT, MODEL_AUTO
+from .protocol import SonyProjectorADCP, async_open_projector
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _blocking(name: str) -> Callable[..., Any]:
+    """Return a method that runs SonyProjectorADCP.<name> and waits for it."""
+
+    def method(self: "SyncProjector", *args: Any, **kwargs: Any) -> Any:
+        return self.call(name, *args, **kwargs)
+
+    method.__name__ = name
+    method.__doc__ = f"Blocking version of SonyProjectorADCP.{name}."
+    return method
+
+
+class SyncProjector:
+    """Blocking and future-based access to one pooled projector."""
+
+    def __init__(self, client: "SyncClient", host: str, port: int) -> None:
+        """Initialize the handle; the connection is opened on first use."""
+        self._client = client
+        self.host = host
+        self.port = port
+
+    def submit(
+        self, name: str, *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future:
+        """Run SonyProjectorADCP.<name> in the background and return a future."""
+        return self._client.submit(self.host, self.port, name, *args, **kwargs)
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Run SonyProjectorADCP.<name> and wait for its result."""
+        return self._client.wait(self.submit(name, *args, **kwargs))
+
+    # Getters
+    get_power_status = _blocking("get_power_status")
+    get_input = _blocking("get_input")
+    get_blank_status = _blocking("get_blank_status")
+    get_picture_mode = _blocking("get_picture_mode")
+    get_numeric_value = _blocking("get_numeric_value")
+    get_reality_creation = _blocking("get_reality_creation")
+    get_model_name = _blocking("get_model_name")
+    query = _blocking("query")
+    query_many = _blocking("query_many")
+
+    # Setters
+    set_power = _blocking("set_power")
+    set_input = _blocking("set_input")
+    set_blank = _blocking("set_blank")
+    set_picture_mode = _blocking("set_picture_mode")
+    set_numeric_value = _blocking("set_numeric_value")
+    set_reality_creation = _blocking("set_reality_creation")
+    set_value = _blocking("set_value")
+    send_key = _blocking("send_key")
+
+    # Raw commands and batches
+    send_command = _blocking("send_command")
+    send_batch = _blocking("send_batch")
+
+
+class SyncClient:
+    """Run ADCP clients for many projectors on one background event loop."""
+
+    def __init__(
+        self,
+        password: str = DEFAULT_PASSWORD,
+        use_auth: bool = True,
+        model: str = MODEL_AUTO,
+        port: int = DEFAULT_PORT,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize the client and start its event loop thread.
+
+        The credentials and model apply to every projector. Blocking calls
+        wait at most timeout seconds, or as long as the ADCP timeouts allow
+        when it is None.
+        """
+        self.password = password
+        self.use_auth = use_auth
+        self.model = model
+        self.port = port
+        self.timeout = timeout
+
+        # Only touched from the loop thread
+        self._projectors: Dict[Tuple[str, int], SonyProjectorADCP] = {}
+        self._opening: Dict[Tuple[str, int], asyncio.Task] = {}
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="sony_projector_adcp", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+
+    def __enter__(self) -> "SyncClient":
+        """Return the client."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the client."""
+        self.close()
+
+    def projector(self, host: str, port: Optional[int] = None) -> SyncProjector:
+        """Return a handle for one projector."""
+        return SyncProjector(self, host, self.port if port is None else port)
+
+    def submit(
+        self, host: str, port: int, name: str, *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future:
+        """Run SonyProjectorADCP.<name> for a projector and return a future."""
+        if self._closed:
+            raise RuntimeError("SyncClient is closed")
+        return asyncio.run_coroutine_threadsafe(
+            self._async_call((host, port), name, args, kwargs), self._loop
+        )
+
+    def wait(self, future: concurrent.futures.Future) -> Any:
+        """Wait for a future returned by submit."""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Blocking call from the SyncClient event loop")
+        return future.result(self.timeout)
+
+    def close(self) -> None:
+        """Disconnect every projector and stop the event loop thread."""
+        if self._closed:
+            return
+        self._closed = True
+        asyncio.run_coroutine_threadsafe(self._async_close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _async_call(
+        self,
+        key: Tuple[str, int],
+        name: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Run one client method on the pooled projector."""
+        projector = await self._async_get(key)
+        return await getattr(projector, name)(*args, **kwargs)
+
+    async def _async_get(self, key: Tuple[str, int]) -> SonyProjectorADCP:
+        """Return the pooled projector for key, opening it once."""
+        projector = self._projectors.get(key)
+        if projector is not None:
+            return projector
+
+        # Concurrent first calls share one connection attempt
+        task = self._opening.get(key)
+        if task is None:
+            task = self._loop.create_task(
+                async_open_projector(*key, self.password, self.use_auth, self.model)
+            )
+            self._opening[key] = task
+        try:
+            projector = await asyncio.shield(task)
+        finally:
+            if self._opening.get(key) is task and task.done():
+                del self._opening[key]
+
+        self._projectors[key] = projector
+        _LOGGER.debug("Pooled projector %s:%s", *key)
+        return projector
+
+    async def _async_close(self) -> None:
+        """Disconnect every pooled projector."""
+        for task in self._opening.values():
+            task.cancel()
+        for projector in self._projectors.values():
+            await projector.disconnect()
+        self._projectors.clear()
@@ -0,0 +1,252 @@
+"""Low-rate telemetry sampling for Sony Projector ADCP.
+
+Light source hours, temperatures and error/warning codes change slowly, so
+they are sampled on their own slow tier instead of the picture-setting
+poll. All telemetry queries of a sample go out as one pipelined batch of
+pre-encoded commands, and numeric history is kept in fixed-size,
+array-backed ring buffers with downsampling so memory stays constant.
+"""
+from array import array
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import ParameterSpec
+from .protocol import SonyProjectorADCP
+from .response import is_error
+
+_LOGGER = logging.getLogger(__name__)
+
+KIND_HOURS = "hours"
+KIND_TEMPERATURE = "temperature"
+KIND_CODES = "codes"
+
+NUMERIC_KINDS = (KIND_HOURS, KIND_TEMPERATURE)
+
+# Response that marks a query the projector does not understand
+ERROR_UNSUPPORTED = "err_cmd"
+
+# History sizes: one day of full-resolution samples at the default 5 minute
+# interval, then two weeks of hourly averages.
+HISTORY_FINE_SIZE = 288
+HISTORY_COARSE_SIZE = 336
+HISTORY_DOWNSAMPLE = 12
+
+SECONDS_PER_HOUR = 3600
+
+
+class _Ring:
+    """A fixed-capacity ring of (timestamp, value) samples."""
+
+    __slots__ = ("times", "values", "capacity", "start", "count")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the ring."""
+        self.times = array("I", bytes(4 * capacity))
+        self.values = array("f", bytes(4 * capacity))
+        self.capacity = capacity
+        self.start = 0
+        self.count = 0
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, overwriting the oldest one when full."""
+        index = (self.start + self.count) % self.capacity
+        self.times[index] = int(timestamp)
+        self.values[index] = value
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def samples(self) -> List[Tuple[int, float]]:
+        """Return the samples from oldest to newest."""
+        return [
+            (
+                self.times[(self.start + i) % self.capacity],
+                self.values[(self.start + i) % self.capacity],
+            )
+            for i in range(self.count)
+        ]
+
+
+class TelemetryHistory:
+    """Two-tier numeric history with downsampling.
+
+    Recent samples are kept at full resolution. Every ``downsample`` samples
+    are also averaged into a coarse tier that covers a longer time span.
+    """
+
+    __slots__ = ("fine", "coarse", "downsample", "_bucket_sum", "_bucket_count")
+
+    def __init__(
+        self,
+        fine_size: int = HISTORY_FINE_SIZE,
+        coarse_size: int = HISTORY_COARSE_SIZE,
+        downsample: int = HISTORY_DOWNSAMPLE,
+    ) -> None:
+        """Initialize the history."""
+        self.fine = _Ring(fine_size)
+        self.coarse = _Ring(coarse_size)
+        self.downsample = downsample
+        self._bucket_sum = 0.0
+        self._bucket_count = 0
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Record a sample."""
+        self.fine.append(timestamp, value)
+        self._bucket_sum += value
+        self._bucket_count += 1
+        if self._bucket_count >= self.downsample:
+            self.coarse.append(timestamp, self._bucket_sum / self._bucket_count)
+            self._bucket_sum = 0.0
+            self._bucket_count = 0
+
+    def trend(self) -> Optional[float]:
+        """Return the least-squares slope of the recent samples, per hour."""
+        return _slope(self.fine.samples())
+
+    def long_term_trend(self) -> Optional[float]:
+        """Return the least-squares slope of the downsampled tier, per hour."""
+        return _slope(self.coarse.samples())
+
+
+def _slope(samples: List[Tuple[int, float]]) -> Optional[float]:
+    """Return the least-squares slope of samples, per hour."""
+    if len(samples) < 2:
+        return None
+
+    count = len(samples)
+    mean_t = sum(t for t, _ in samples) / count
+    mean_v = sum(v for _, v in samples) / count
+    variance = sum((t - mean_t) ** 2 for t, _ in samples)
+    if not variance:
+        return None
+    covariance = sum((t - mean_t) * (v - mean_v) for t, v in samples)
+    return covariance / variance * SECONDS_PER_HOUR
+
+
+class TelemetryChannel:
+    """A compiled telemetry value read from one ADCP parameter."""
+
+    __slots__ = ("key", "kind", "parameter", "field", "none")
+
+    def __init__(self, key: str, definition: Dict[str, Any]) -> None:
+        """Compile a telemetry definition from a model profile."""
+        self.key = key
+        self.kind: str = definition["kind"]
+        self.parameter: str = definition["parameter"]
+        self.field: Optional[str] = definition.get("field")
+        self.none: Optional[str] = definition.get("none")
+
+    def extract(self, decoded: Any) -> Any:
+        """Extract this channel's value from a decoded response."""
+        if self.kind == KIND_CODES:
+            if isinstance(decoded, str):
+                decoded = [decoded]
+            if not isinstance(decoded, list):
+                return None
+            return tuple(
+                code for code in decoded if isinstance(code, str) and code != self.none
+            )
+
+        # Responses are either an object or a list of single-key objects
+        if isinstance(decoded, list):
+            merged: Dict[str, Any] = {}
+            for item in decoded:
+                if isinstance(item, dict):
+                    merged.update(item)
+            decoded = merged
+        if isinstance(decoded, dict) and self.field is not None:
+            decoded = decoded.get(self.field)
+        if isinstance(decoded, (int, float)) and not isinstance(decoded, bool):
+            return decoded
+        return None
+
+
+class TelemetrySampler:
+    """Sample projector telemetry and keep a compact history."""
+
+    def __init__(self, projector: SonyProjectorADCP) -> None:
+        """Initialize the sampler from the projector's model profile."""
+        self._projector = projector
+        profile = projector.profile
+
+        self.channels: Dict[str, TelemetryChannel] = {}
+        for key, definition in profile.telemetry.items():
+            channel = TelemetryChannel(key, definition)
+            if not profile.supports(channel.parameter):
+                _LOGGER.warning(
+                    "Telemetry %s uses undeclared parameter %s", key, channel.parameter
+                )
+                continue
+            self.channels[key] = channel
+
+        # One query per parameter, however many channels read from it
+        self._queries: Dict[str, ParameterSpec] = {
+            channel.parameter: profile.parameter(channel.parameter)
+            for channel in self.channels.values()
+        }
+
+        self.latest: Dict[str, Any] = {}
+        self.updated: Optional[float] = None
+        self.history: Dict[str, TelemetryHistory] = {
+            key: TelemetryHistory()
+            for key, channel in self.channels.items()
+            if channel.kind in NUMERIC_KINDS
+        }
+
+    async def async_sample(self) -> Dict[str, Tuple[str, ...]]:
+        """Take one sample and return the codes that newly appeared per channel."""
+        if not self._queries:
+            return {}
+
+        parameters = list(self._queries)
+        responses = await self._projector.send_encoded_batch(
+            [self._queries[parameter].query for parameter in parameters]
+        )
+
+        decoded: Dict[str, Any] = {}
+        for parameter, response in zip(parameters, responses):
+            if response == ERROR_UNSUPPORTED:
+                # Never ask again for something this projector does not know
+                _LOGGER.info(
+                    "Projector %s does not support %s telemetry",
+                    self._projector.host,
+                    parameter,
+                )
+                del self._queries[parameter]
+            elif response is not None and not is_error(response):
+                decoded[parameter] = self._queries[parameter].decode(response)
+
+        now = time.time()
+        new_codes: Dict[str, Tuple[str, ...]] = {}
+        for key, channel in self.channels.items():
+            if channel.parameter not in decoded:
+                continue
+            value = channel.extract(decoded[channel.parameter])
+            if value is None:
+                continue
+
+            if channel.kind == KIND_CODES:
+                previous = self.latest.get(key, ())
+                appeared = tuple(code for code in value if code not in previous)
+                if appeared:
+                    new_codes[key] = appeared
+            else:
+                self.history[key].append(now, value)
+
+            self.latest[key] = value
+
+        if decoded:
+            self.updated = now
+        return new_codes
+
+    def trend(self, key: str) -> Optional[float]:
+        """Return the per-hour trend of a numeric channel over the last day."""
+        history = self.history.get(key)
+        return history.trend() if history else None
+
+    def long_term_trend(self, key: str) -> Optional[float]:
+        """Return the per-hour trend of a numeric channel over two weeks."""
+        history = self.history.get(key)
+        return history.long_term_trend() if history else None
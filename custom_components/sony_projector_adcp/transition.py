@@ -0,0 +1,111 @@
+"""Timed transitions for numeric projector settings.
+
+A transition fades one numeric parameter from its current value to a target
+over a given duration. Each parameter has at most one running transition;
+a new target for the same parameter replaces it. Steps are sent back to
+back, as fast as the link answers, and the value of each step is computed
+from the elapsed time, so intermediate steps are dropped when the link
+falls behind and the fade still ends on time.
+"""
+import asyncio
+import logging
+from typing import Callable, Dict, Optional
+
+from .protocol import SonyProjectorADCP
+
+_LOGGER = logging.getLogger(__name__)
+
+StepCallback = Callable[[int, bool], None]
+
+
+class TransitionScheduler:
+    """Run at most one timed transition per parameter."""
+
+    def __init__(self, projector: SonyProjectorADCP) -> None:
+        """Initialize the scheduler."""
+        self._projector = projector
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def is_running(self, parameter: str) -> bool:
+        """Return True if a transition is running for parameter."""
+        task = self._tasks.get(parameter)
+        return task is not None and not task.done()
+
+    def start(
+        self,
+        parameter: str,
+        start: int,
+        target: int,
+        duration: float,
+        on_step: Optional[StepCallback] = None,
+    ) -> asyncio.Task:
+        """Start a transition, replacing any running one for parameter."""
+        self.cancel(parameter)
+        task = asyncio.get_running_loop().create_task(
+            self._async_run(parameter, start, target, duration, on_step)
+        )
+        self._tasks[parameter] = task
+        task.add_done_callback(lambda done: self._forget(parameter, done))
+        return task
+
+    def cancel(self, parameter: str) -> None:
+        """Cancel the running transition for parameter, if any."""
+        task = self._tasks.pop(parameter, None)
+        if task is not None and not task.done():
+            _LOGGER.debug("Cancelling %s transition", parameter)
+            task.cancel()
+
+    def cancel_all(self) -> None:
+        """Cancel every running transition."""
+        for parameter in list(self._tasks):
+            self.cancel(parameter)
+
+    def _forget(self, parameter: str, task: asyncio.Task) -> None:
+        """Drop a finished task unless it was already replaced."""
+        if self._tasks.get(parameter) is task:
+            del self._tasks[parameter]
+
+    async def _async_run(
+        self,
+        parameter: str,
+        start: int,
+        target: int,
+        duration: float,
+        on_step: Optional[StepCallback],
+    ) -> None:
+        """Send steps until the target is reached."""
+        loop = asyncio.get_running_loop()
+        began = loop.time()
+        span = target - start
+        direction = 1 if span > 0 else -1
+        current = start
+        steps = 0
+
+        while current != target:
+            elapsed = loop.time() - began
+            if elapsed >= duration:
+                value = target
+            else:
+                value = start + int(span * elapsed / duration)
+
+            if value == current:
+                # Sleep until the next whole step is due
+                due = began + duration * (current + direction - start) / span
+                await asyncio.sleep(max(due - loop.time(), 0))
+                continue
+
+            # Shield the exchange so a cancel never cuts a command in half
+            await asyncio.shield(self._projector.set_numeric_value(parameter, value))
+            current = value
+            steps += 1
+            if on_step:
+                on_step(value, value == target)
+
+        _LOGGER.debug(
+            "%s transition %s -> %s finished in %.2fs with %d steps",
+            parameter,
+            start,
+            target,
+            loop.time() - began,
+            steps,
+        )